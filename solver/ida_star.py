@@ -0,0 +1,176 @@
+"""
+IDA* search kernel for the Master Kilominx solver.
+
+The recursion operates on a flat uint8[240] state buffer, an int16
+permutation table for the move set, and plain scalars — no Python
+containers — so the hot loop can be JIT-compiled with Numba when it is
+installed. Without Numba the same code runs as pure Python, just slower.
+"""
+
+import numpy as np
+
+from solver.kilominx_model import MOVES, Face, NUM_FACES, STICKERS_PER_FACE
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+# Stable move ordering: MOVE_NAMES[i] is the notation for move id i, and
+# MOVE_PERMS[i] is its sticker permutation.
+MOVE_NAMES = tuple(MOVES.keys())
+MOVE_PERMS = np.stack([MOVES[name] for name in MOVE_NAMES]).astype(np.int16)
+
+# Flat solved state: sticker i belongs to face i // 20
+SOLVED_FLAT = np.repeat(
+    np.arange(NUM_FACES, dtype=np.uint8), STICKERS_PER_FACE
+)
+
+# Maximum search depth supported by the preallocated path buffer
+MAX_DEPTH = 60
+
+# Antipodal face pairs, derived from F's neighbor ring {U, R, D, L, BR}:
+# the opposite of each neighbor of F must be a neighbor of B.
+_OPPOSITE_FACE = {}
+for _a, _b in ((Face.F, Face.B), (Face.U, Face.BD), (Face.D, Face.BU),
+               (Face.R, Face.BL), (Face.L, Face.UR), (Face.BR, Face.UL)):
+    _OPPOSITE_FACE[int(_a)] = int(_b)
+    _OPPOSITE_FACE[int(_b)] = int(_a)
+del _a, _b
+
+def _build_legal_next():
+    """
+    Build the successor-move pruning table.
+
+    Row prev+1 lists the move ids worth trying after move id `prev`
+    (row 0 is the root, where every move is legal). Moves on the same
+    face as the previous move are redundant, and commuting moves on
+    opposite faces are canonicalized to one ordering, cutting the
+    branching factor without losing any shortest solution.
+
+    Returns:
+        tuple: (legal_next, legal_count) where legal_next is an
+            int16[N_MOVES + 1, N_MOVES] padded table and legal_count
+            gives each row's valid length.
+    """
+    n_moves = len(MOVE_NAMES)
+    face_of = [int(Face[name.rstrip("'2")]) for name in MOVE_NAMES]
+    legal_next = np.zeros((n_moves + 1, n_moves), dtype=np.int16)
+    legal_count = np.zeros(n_moves + 1, dtype=np.int16)
+    for prev in range(-1, n_moves):
+        count = 0
+        for nxt in range(n_moves):
+            if prev >= 0:
+                prev_face, next_face = face_of[prev], face_of[nxt]
+                if next_face == prev_face:
+                    continue
+                if (_OPPOSITE_FACE.get(prev_face) == next_face
+                        and next_face < prev_face):
+                    continue
+            legal_next[prev + 1, count] = nxt
+            count += 1
+        legal_count[prev + 1] = count
+    return legal_next, legal_count
+
+# Successor pruning tables, built once at import
+LEGAL_NEXT, LEGAL_COUNT = _build_legal_next()
+
+# Sentinel returned by _search when a solution has been found
+_FOUND = -1
+
+@njit(cache=True)
+def _heuristic(flat):
+    """
+    Admissible lower bound on moves-to-solve for a flat state.
+
+    Counts misplaced stickers; a single move repositions at most 20
+    stickers, so ceil(wrong / 20) moves are required.
+    """
+    wrong = 0
+    for i in range(flat.shape[0]):
+        if flat[i] != i // STICKERS_PER_FACE:
+            wrong += 1
+    return (wrong + STICKERS_PER_FACE - 1) // STICKERS_PER_FACE
+
+@njit(cache=True)
+def _search(flat, g, bound, prev_move, move_perms, legal_next, legal_count, path):
+    """
+    Depth-first cost-bounded search from `flat`.
+
+    Args:
+        flat: Flat uint8[240] state buffer.
+        g: Cost (moves) spent so far.
+        bound: Current IDA* f-cost bound.
+        prev_move: Move id that produced `flat` (-1 at the root).
+        move_perms: int16[N_MOVES, 240] permutation table.
+        legal_next: int16[N_MOVES + 1, N_MOVES] successor pruning table.
+        legal_count: int16[N_MOVES + 1] row lengths for legal_next.
+        path: Preallocated int16[MAX_DEPTH] move-id buffer, filled with
+            the solution on success.
+
+    Returns:
+        _FOUND (with `path[:g]` holding the solution) if solved within
+        the bound, otherwise the minimum f-cost that exceeded it.
+    """
+    h = _heuristic(flat)
+    if h == 0:
+        return _FOUND
+    f = g + h
+    if f > bound or g >= path.shape[0]:
+        return f
+    min_next = 0x7FFFFFFF
+    row = prev_move + 1
+    for k in range(legal_count[row]):
+        mid = legal_next[row, k]
+        child = flat[move_perms[mid]]
+        path[g] = mid
+        t = _search(child, g + 1, bound, mid, move_perms,
+                    legal_next, legal_count, path)
+        if t == _FOUND:
+            return _FOUND
+        if t < min_next:
+            min_next = t
+    return min_next
+
+def ida_star(cube, max_depth=MAX_DEPTH):
+    """
+    Find a move sequence solving `cube` via iterative deepening A*.
+
+    Args:
+        cube (MasterKilominx): The puzzle state to solve.
+        max_depth (int): Depth cap; the search gives up beyond it.
+
+    Returns:
+        list or None: Solution as a list of move strings, or None if no
+            solution was found within `max_depth`.
+    """
+    flat = np.ascontiguousarray(cube.state.reshape(-1))
+    path = np.empty(min(max_depth, MAX_DEPTH), dtype=np.int16)
+    bound = _heuristic(flat)
+    while bound <= max_depth:
+        result = _search(flat, 0, bound, -1, MOVE_PERMS,
+                         LEGAL_NEXT, LEGAL_COUNT, path)
+        if result == _FOUND:
+            depth = _solution_depth(flat, path)
+            return [MOVE_NAMES[mid] for mid in path[:depth]]
+        bound = result
+    return None
+
+def _solution_depth(flat, path):
+    """Replay `path` from `flat` until solved to recover its length."""
+    state = flat.copy()
+    for depth in range(path.shape[0]):
+        if np.array_equal(state, SOLVED_FLAT):
+            return depth
+        state = state[MOVE_PERMS[path[depth]]]
+    return path.shape[0]
@@ -3,10 +3,13 @@ Data model representing the Master Kilominx puzzle with proper 20-sticker layout
 """
 
 import numpy as np
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
-class Face(Enum):
+from solver.move_notation import MoveNotation
+
+class Face(IntEnum):
     """Enumeration of the 12 faces of a dodecahedron."""
     F = 0  # Front
     U = 1  # Up
@@ -21,7 +24,7 @@ class Face(Enum):
     UL = 10  # Up-Left
     UR = 11  # Up-Right
 
-class StickerType(Enum):
+class StickerType(IntEnum):
     """Types of stickers on a Master Kilominx face."""
     CORNER = 0        # 5 corners (at pentagon vertices)
     EDGE = 1          # 5 edges (along pentagon edges)
@@ -29,50 +32,237 @@ class StickerType(Enum):
     CENTER_PIECE = 3  # 5 center pieces (around super center)
     SUPER_CENTER = 4  # 1 super center (middle of face)
 
+# Number of faces and stickers per face
+NUM_FACES = 12
+STICKERS_PER_FACE = 20
+
+# Bit shifts for packing a face into two uint64 words with 4-bit lanes:
+# stickers 0-15 go into word 0, stickers 16-19 into word 1.
+_PACK_SHIFTS_LO = np.arange(16, dtype=np.uint64) * np.uint64(4)
+_PACK_SHIFTS_HI = np.arange(4, dtype=np.uint64) * np.uint64(4)
+
+# Packed words for a solved face: the face's own color replicated into
+# every 4-bit lane (16 lanes in word 0, 4 lanes in word 1).
+SOLVED_WORDS = np.empty((NUM_FACES, 2), dtype=np.uint64)
+for _f in range(NUM_FACES):
+    SOLVED_WORDS[_f, 0] = (_f * 0x1111111111111111) & 0xFFFFFFFFFFFFFFFF
+    SOLVED_WORDS[_f, 1] = _f * 0x1111
+del _f
+
+def _build_face_rotations():
+    """
+    Build fixed 20-element index permutations for rotating one face.
+
+    For each direction (1 = clockwise fifth-turn, -1 = counter-clockwise,
+    2 = double turn), entry d of the permutation gives the source index
+    of the sticker that lands at position d. Each of the four rings of 5
+    stickers cycles by the direction.
+
+    Returns:
+        dict: Mapping of direction to an int16[20] permutation.
+    """
+    rotations = {}
+    for direction in (1, -1, 2):
+        perm = np.empty(STICKERS_PER_FACE, dtype=np.int16)
+        for ring_start in (0, 5, 10, 15):
+            for i in range(5):
+                perm[ring_start + i] = ring_start + (i - direction) % 5
+        rotations[direction] = perm
+    return rotations
+
+# On-face rotation permutations, indexed by direction
+FACE_ROTATIONS = _build_face_rotations()
+
+def _build_move_permutations():
+    """
+    Build the global sticker permutation table for every legal move.
+
+    Each move is encoded as an int16 array of length 240 (12 faces x 20
+    stickers) giving, for each destination sticker index, its source index
+    under that move. Applying a move is then a single fused gather:
+    ``new_flat = flat[MOVES[move]]``.
+
+    Returns:
+        dict: Mapping of move strings (e.g. "F", "U'", "BR2") to
+            permutation arrays.
+    """
+    moves = {}
+    total = NUM_FACES * STICKERS_PER_FACE
+    for face in Face:
+        base = face * STICKERS_PER_FACE
+        for suffix, direction in (("", 1), ("'", -1), ("2", 2)):
+            perm = np.arange(total, dtype=np.int16)
+            # Splice the fixed on-face rotation into the global identity
+            perm[base:base + STICKERS_PER_FACE] = base + FACE_ROTATIONS[direction]
+            # Adjacent-face sticker cycles would be composed in here once
+            # the full dodecahedral adjacency tables are defined.
+            moves[face.name + suffix] = perm
+    return moves
+
+# Permutation table for all 36 moves (12 faces x 3 rotations), built once
+# at import time.
+MOVES = _build_move_permutations()
+
+def _invert_permutations(moves):
+    """
+    Build the inverse permutation for every move.
+
+    Needed because not every inverse is itself a legal move string on a
+    pentagonal face (e.g. the inverse of a double turn is three
+    fifth-turns).
+
+    Args:
+        moves (dict): Mapping of move strings to permutations.
+
+    Returns:
+        dict: Mapping of move strings to the inverse permutations.
+    """
+    inverses = {}
+    for name, perm in moves.items():
+        inv = np.empty_like(perm)
+        inv[perm] = np.arange(perm.shape[0], dtype=perm.dtype)
+        inverses[name] = inv
+    return inverses
+
+# Inverse permutation table, for undoing moves during backtracking
+IMOVES = _invert_permutations(MOVES)
+
+@lru_cache(maxsize=None)
+def _compose_moves(moves):
+    """
+    Fuse a move sequence into one sticker permutation.
+
+    Move composition is associative on the permutation representation,
+    so an N-move algorithm collapses to a single gather. Cached on the
+    token tuple since canned algorithms recur.
+
+    Args:
+        moves (tuple): Move strings in application order.
+
+    Returns:
+        ndarray: int16[240] combined permutation.
+    """
+    perm = np.arange(NUM_FACES * STICKERS_PER_FACE, dtype=np.int16)
+    for move in moves:
+        perm = perm[MOVES[move]]
+    return perm
+
+# Decoded (face_idx, direction) for every legal move string, built once so
+# _parse_move never slices or validates strings at call time.
+MOVE_TABLE = {
+    face.name + suffix: (int(face), direction)
+    for face in Face
+    for suffix, direction in (("", 1), ("'", -1), ("2", 2))
+}
+
+# Base sticker index for each StickerType, indexed by StickerType
+_STICKER_OFFSET = (0, 5, 10, 15, 19)
+
 class MasterKilominx:
     """
     Data structure representing a Master Kilominx (4x4 dodecahedral Rubik's cube).
     Each pentagonal face has 20 stickers arranged in a specific pattern.
+
+    The state is stored as a single contiguous (12, 20) uint8 ndarray so that
+    copying a state in the move path is one memcpy instead of a Python-level
+    dict/list walk. Dict-shaped states (as produced by the UI and image
+    processing layers) are converted at the API boundary only.
     """
-    
+
     def __init__(self, state=None):
         """
         Initialize a Master Kilominx model.
-        
+
         Args:
-            state (dict, optional): Initial state of the puzzle with face indices as keys
-                                  and lists of color values as values.
+            state (dict or ndarray, optional): Initial state of the puzzle.
+                Either a (12, 20) uint8 array of color indices, or a legacy
+                dict with face indices as keys and lists of color values as
+                values.
         """
         # Number of stickers per face
-        self.stickers_per_face = 20
-        
+        self.stickers_per_face = STICKERS_PER_FACE
+
         # Sticker distribution
         self.corners_per_face = 5
         self.edges_per_face = 5
         self.middle_edges_per_face = 5
         self.center_pieces_per_face = 5
         self.super_center_per_face = 1
-        
+
+        # Palette used to translate raw color values (e.g. RGB triples from
+        # the UI) to small color indices, and back in to_dict().
+        self._palette = None
+
         # Initialize with solved state if no state is provided
         if state is None:
-            # Create a solved state with 12 faces
-            self.state = {}
-            for face in Face:
-                # Create 20 stickers of the same color for each face
-                self.state[face.value] = [face.value] * self.stickers_per_face
+            # Solved state: every sticker on face f has color index f
+            self.state = np.empty((NUM_FACES, self.stickers_per_face), dtype=np.uint8)
+            self.state[:] = np.arange(NUM_FACES, dtype=np.uint8)[:, None]
+        elif isinstance(state, np.ndarray):
+            self.state = state.astype(np.uint8, copy=True)
         else:
-            # Convert input state to internal representation
-            self.state = {}
-            for face_idx, face_colors in state.items():
-                if isinstance(face_idx, str) and face_idx.startswith("face_"):
-                    face_num = int(face_idx.split("_")[1])
-                    self.state[face_num] = face_colors
-                else:
-                    self.state[face_idx] = face_colors
-        
+            # Convert legacy dict state to the internal ndarray representation
+            self.state = self._from_dict(state)
+
         # Initialize adjacency relationships
         self._init_adjacency()
-        
+
+    def _from_dict(self, state):
+        """
+        Convert a legacy dict state to a (12, 20) uint8 ndarray.
+
+        Args:
+            state (dict): Mapping of face indices (ints or "face_N" strings)
+                to lists of color values. Values may be small ints or RGB
+                triples; RGB triples are assigned color indices in order of
+                first appearance.
+
+        Returns:
+            ndarray: The (12, 20) uint8 state array.
+        """
+        array = np.zeros((NUM_FACES, self.stickers_per_face), dtype=np.uint8)
+        palette = {}
+
+        for face_idx, face_colors in state.items():
+            if isinstance(face_idx, str) and face_idx.startswith("face_"):
+                face_num = int(face_idx.split("_")[1])
+            else:
+                face_num = face_idx
+
+            for sticker_idx, color in enumerate(face_colors):
+                if isinstance(color, (list, tuple)):
+                    # RGB triple: map to a small color index
+                    key = tuple(color)
+                    if key not in palette:
+                        palette[key] = len(palette)
+                    value = palette[key]
+                else:
+                    value = int(color)
+                array[face_num, sticker_idx] = value
+
+        if palette:
+            # Remember the palette so to_dict() can round-trip RGB values
+            self._palette = [list(key) for key in palette]
+
+        return array
+
+    def to_dict(self):
+        """
+        Export the state as a legacy dict for the UI/validator boundary.
+
+        Returns:
+            dict: Mapping of face indices to lists of color values. If the
+                state was built from RGB triples, the original colors are
+                restored from the palette.
+        """
+        result = {}
+        for face_idx in range(NUM_FACES):
+            colors = self.state[face_idx].tolist()
+            if self._palette is not None:
+                colors = [self._palette[c] for c in colors]
+            result[face_idx] = colors
+        return result
+
     def _init_adjacency(self):
         """
         Initialize the adjacency relationships between faces.
@@ -81,91 +271,227 @@ class MasterKilominx:
         # Adjacency mapping for a dodecahedron
         # Each face is adjacent to 5 other faces
         self.adjacency = {
-            Face.F.value: [
-                (Face.U.value, [1, 2, 3]),  # Up face: corner 1, edge 1, corner 2
-                (Face.R.value, [0, 5, 1]),  # Right face: corner 0, edge 0, corner 1
-                (Face.D.value, [0, 7, 4]),  # Down face: corner 0, edge 2, corner 4
-                (Face.L.value, [4, 9, 3]),  # Left face: corner 4, edge 4, corner 3
-                (Face.BR.value, [2, 6, 3])  # Back-Right face: corner 2, edge 3, corner 3
+            Face.F: [
+                (Face.U, [1, 2, 3]),   # Up face: corner 1, edge 1, corner 2
+                (Face.R, [0, 5, 1]),   # Right face: corner 0, edge 0, corner 1
+                (Face.D, [0, 7, 4]),   # Down face: corner 0, edge 2, corner 4
+                (Face.L, [4, 9, 3]),   # Left face: corner 4, edge 4, corner 3
+                (Face.BR, [2, 6, 3])   # Back-Right face: corner 2, edge 3, corner 3
             ],
             # Additional adjacencies would be defined here for all 12 faces
             # This is a simplified representation
         }
-        
+
+    def get_face(self, face_idx):
+        """
+        Get all sticker colors on a face.
+
+        Args:
+            face_idx: The index of the face.
+
+        Returns:
+            ndarray: The 20 sticker color indices of the face.
+        """
+        return self.state[face_idx]
+
     def get_sticker(self, face_idx, sticker_type, type_index):
         """
         Get a specific sticker from a face.
-        
+
         Args:
             face_idx: The index of the face.
             sticker_type: Type of sticker (CORNER, EDGE, etc.)
             type_index: Index within that sticker type (0-4 for most types)
-            
+
         Returns:
             The color value of the sticker.
         """
-        if face_idx not in self.state:
+        if not 0 <= face_idx < NUM_FACES:
             return None
-            
-        # Calculate sticker index based on type and index
-        if sticker_type == StickerType.CORNER:
-            idx = type_index
-        elif sticker_type == StickerType.EDGE:
-            idx = 5 + type_index
-        elif sticker_type == StickerType.MIDDLE_EDGE:
-            idx = 10 + type_index
-        elif sticker_type == StickerType.CENTER_PIECE:
-            idx = 15 + type_index
-        elif sticker_type == StickerType.SUPER_CENTER:
-            idx = 19
-        else:
+
+        # Base offset comes straight from the per-type table; the super
+        # center ignores type_index since there is only one
+        if not isinstance(sticker_type, StickerType):
             return None
-            
-        if 0 <= idx < len(self.state[face_idx]):
-            return self.state[face_idx][idx]
+        if sticker_type == StickerType.SUPER_CENTER:
+            idx = _STICKER_OFFSET[sticker_type]
+        else:
+            idx = _STICKER_OFFSET[sticker_type] + type_index
+
+        if 0 <= idx < self.stickers_per_face:
+            return int(self.state[face_idx, idx])
         return None
-        
+
+    def set_sticker(self, face_idx, sticker_idx, color):
+        """
+        Set the color of a specific sticker.
+
+        Args:
+            face_idx: The index of the face.
+            sticker_idx: The flat sticker index on the face (0-19).
+            color: The color index to set.
+        """
+        self.state[face_idx, sticker_idx] = color
+
+    def pack_state(self):
+        """
+        Pack the state into a (12, 2) uint64 bitboard with 4-bit color lanes.
+
+        With 12 colors fitting in 4 bits, each face packs into 80 bits:
+        stickers 0-15 in the first word and stickers 16-19 in the second.
+
+        Returns:
+            ndarray: The (12, 2) uint64 packed representation.
+        """
+        s = self.state.astype(np.uint64)
+        packed = np.empty((NUM_FACES, 2), dtype=np.uint64)
+        packed[:, 0] = np.bitwise_or.reduce(s[:, :16] << _PACK_SHIFTS_LO, axis=1)
+        packed[:, 1] = np.bitwise_or.reduce(s[:, 16:] << _PACK_SHIFTS_HI, axis=1)
+        return packed
+
+    def state_key(self):
+        """
+        Get a cheap hashable key for this state.
+
+        Suitable for visited sets and transposition tables in the solver:
+        hashing 192 bytes of packed words instead of walking 240 stickers.
+
+        Returns:
+            bytes: The packed bitboard as raw bytes.
+        """
+        return self.pack_state().tobytes()
+
+    def is_solved(self):
+        """
+        Check whether the puzzle is in the solved state.
+
+        A single vectorized compare of every sticker against its face's
+        first sticker — one pass over the 240-byte buffer, no per-sticker
+        Python dispatch. Checking uniformity rather than identity coloring
+        also handles states whose palette indices were assigned in
+        first-appearance order by _from_dict.
+
+        Returns:
+            bool: True if every face is uniformly one color.
+        """
+        return bool(np.all(self.state == self.state[:, 0:1]))
+
     def apply_move(self, move):
         """
         Apply a move to the puzzle.
-        
+
         Args:
             move: The move to apply, in standard notation.
-            
+
         Returns:
             A new MasterKilominx instance with the move applied.
         """
-        # Parse the move notation
-        face, direction = self._parse_move(move)
-        
-        # Create a copy of the current state
-        new_state = {k: v.copy() for k, v in self.state.items()}
-        
-        # Apply the move to the copy
-        new_state = self._rotate_face(new_state, face, direction)
-        
+        perm = MOVES.get(move)
+        if perm is None:
+            raise ValueError(f"Unknown move: {move}")
+
+        # Single fused gather over the flat 240-byte buffer
+        new_state = self.state.reshape(-1)[perm].reshape(NUM_FACES, self.stickers_per_face)
+
         # Create and return a new instance
-        return MasterKilominx(new_state)
-        
+        result = MasterKilominx(new_state)
+        result._palette = self._palette
+        return result
+
+    def apply_algorithm(self, algorithm):
+        """
+        Apply a whole move sequence with a single fused gather.
+
+        Args:
+            algorithm (str or list): Algorithm string (e.g. "R U R' U'")
+                or list of move tokens. Comment tokens are ignored.
+
+        Returns:
+            A new MasterKilominx instance with the sequence applied.
+
+        Raises:
+            ValueError: If the sequence contains an unknown move.
+        """
+        if isinstance(algorithm, str):
+            # Proper tokenization keeps a "# multi word comment" as one
+            # comment token instead of splitting it into bogus moves
+            tokens = MoveNotation.parse_algorithm(algorithm)
+        else:
+            tokens = algorithm
+        moves = tuple(t for t in tokens if not t.startswith('#'))
+
+        unknown = next((m for m in moves if m not in MOVES), None)
+        if unknown is not None:
+            raise ValueError(f"Unknown move: {unknown}")
+
+        perm = _compose_moves(moves)
+        new_state = self.state.reshape(-1)[perm].reshape(
+            NUM_FACES, self.stickers_per_face
+        )
+        result = MasterKilominx(new_state)
+        result._palette = self._palette
+        return result
+
+    def apply_move_inplace(self, move):
+        """
+        Apply a move to this instance, mutating it.
+
+        Search code should prefer this together with undo_move(): a DFS
+        that mutates and backtracks allocates nothing per node, whereas
+        apply_move() allocates a new instance per call.
+
+        Args:
+            move: The move to apply, in standard notation.
+        """
+        self._permute_inplace(MOVES[move])
+
+    def undo_move(self, move):
+        """
+        Undo a previously applied move, mutating this instance.
+
+        Args:
+            move: The move to undo, in standard notation.
+        """
+        self._permute_inplace(IMOVES[move])
+
+    def _permute_inplace(self, perm):
+        """Gather the flat state through `perm` via a reused scratch buffer."""
+        flat = self.state.reshape(-1)
+        scratch = getattr(self, "_scratch", None)
+        if scratch is None:
+            scratch = self._scratch = np.empty_like(flat)
+        np.take(flat, perm, out=scratch)
+        flat[:] = scratch
+
+    def _parse_move(self, move):
+        """
+        Parse a move in standard notation into a face index and direction.
+
+        Args:
+            move (str): Move in standard notation (e.g., "F", "U'", "BR2").
+
+        Returns:
+            tuple: (face_idx, direction) where direction is the number of
+                clockwise fifth-turns (negative for counter-clockwise).
+        """
+        decoded = MOVE_TABLE.get(move)
+        if decoded is None:
+            raise ValueError(f"Unknown move: {move}")
+        return decoded
+
     def _rotate_face(self, state, face_idx, direction):
         """
-        Rotate a face and update adjacent stickers.
-        
+        Rotate a face in place via its fixed index permutation.
+
         Args:
-            state: The current state to modify.
+            state: The (12, 20) state array to modify.
             face_idx: The face to rotate.
-            direction: The rotation direction/count.
-            
+            direction: The rotation direction/count (clockwise fifth-turns).
+
         Returns:
-            The updated state dictionary.
-        """
-        # 1. Rotate the stickers on the face itself
-        face_stickers = state[face_idx].copy()
-        
-        # Implement rotation logic based on direction
-        # This would handle the complex mapping of sticker positions
-        
-        # 2. Update adjacent face stickers
-        # This would handle the effects of rotation on neighboring faces
-        
-        return state
\ No newline at end of file
+            The updated state array.
+        """
+        # One gather against the precomputed permutation — no per-ring
+        # rolls, no list round-trips
+        state[face_idx] = state[face_idx][FACE_ROTATIONS[direction]]
+        return state
@@ -2,6 +2,45 @@
 Utilities for handling Kilominx move notation and translating between formats.
 """
 
+import re
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _to_human(move):
+    """
+    Convert a single move token to a human-readable description.
+
+    Module-level so lru_cache can memoize it: the move alphabet is tiny
+    (36 tokens plus comments), so repeat displays are pure cache hits.
+
+    Args:
+        move (str): Move in standard notation.
+
+    Returns:
+        str: Human-readable description of the move.
+    """
+    # Check if it's a comment
+    if move.startswith('#'):
+        return move[1:].strip()
+
+    # Parse the basic move
+    face = move[0]
+    if len(move) > 1 and face in MoveNotation.FACE_NAMES:
+        # Check for a two-character face name (e.g., BR)
+        if len(move) > 1 and face + move[1] in MoveNotation.FACE_NAMES:
+            face = face + move[1]
+            modifier = move[2:] if len(move) > 2 else ''
+        else:
+            modifier = move[1:] if len(move) > 1 else ''
+    else:
+        modifier = ''
+
+    # Get the face name and direction
+    face_name = MoveNotation.FACE_NAMES.get(face, f"Unknown face '{face}'")
+    direction = MoveNotation.MODIFIERS.get(modifier, "unknown direction")
+
+    return f"Turn the {face_name} face {direction}"
+
 class MoveNotation:
     """Utilities for Kilominx move notation."""
     
@@ -27,6 +66,13 @@ class MoveNotation:
         "'": 'counter-clockwise',
         "2": 'half-turn (180°)'
     }
+
+    # Tokenizer for algorithm strings: a comment running to end-of-line,
+    # a face name (two-letter names before their one-letter prefixes)
+    # with an optional modifier, or — so typos surface downstream as
+    # "Unknown face/move" diagnostics instead of silently vanishing —
+    # any other run of non-whitespace.
+    _TOKEN_RE = re.compile(r"#[^\n]*|(?:BR|BL|BU|BD|UL|UR|[FURDLB])(?:'|2)?|\S+")
     
     @staticmethod
     def to_human_readable(move):
@@ -41,28 +87,8 @@ class MoveNotation:
         """
         if not move:
             return "No move"
-            
-        # Check if it's a comment
-        if move.startswith('#'):
-            return move[1:].strip()
-            
-        # Parse the basic move
-        face = move[0]
-        if len(move) > 1 and face in MoveNotation.FACE_NAMES:
-            # Check for a two-character face name (e.g., BR)
-            if len(move) > 1 and face + move[1] in MoveNotation.FACE_NAMES:
-                face = face + move[1]
-                modifier = move[2:] if len(move) > 2 else ''
-            else:
-                modifier = move[1:] if len(move) > 1 else ''
-        else:
-            modifier = ''
-            
-        # Get the face name and direction
-        face_name = MoveNotation.FACE_NAMES.get(face, f"Unknown face '{face}'")
-        direction = MoveNotation.MODIFIERS.get(modifier, "unknown direction")
-        
-        return f"Turn the {face_name} face {direction}"
+
+        return _to_human(move)
     
     @staticmethod
     def parse_algorithm(algorithm):
@@ -77,39 +103,10 @@ class MoveNotation:
         """
         if not algorithm:
             return []
-            
-        # Split by spaces but preserve comments
-        parts = []
-        current_part = ""
-        in_comment = False
-        
-        for char in algorithm:
-            if char == '#':
-                in_comment = True
-                if current_part:
-                    parts.append(current_part)
-                    current_part = "#"
-                else:
-                    current_part = "#"
-            elif in_comment:
-                if char == '\n':
-                    in_comment = False
-                    parts.append(current_part)
-                    current_part = ""
-                else:
-                    current_part += char
-            elif char.isspace():
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-            else:
-                current_part += char
-                
-        if current_part:
-            parts.append(current_part)
-            
-        # Clean up and return the moves
-        return [part.strip() for part in parts if part.strip()]
+
+        # One scan by the compiled regex engine: comments and moves fall
+        # out as alternations, no per-character state tracking.
+        return [token.strip() for token in MoveNotation._TOKEN_RE.findall(algorithm)]
     
     @staticmethod
     def algorithm_to_human_readable(algorithm):
@@ -148,88 +145,82 @@ class MoveNotation:
         else:
             moves = algorithm.copy()
             
-        # Simplify consecutive moves on the same face
-        i = 0
-        while i < len(moves) - 1:
-            current = moves[i]
-            next_move = moves[i + 1]
-            
-            # Skip comments or non-standard moves
-            if current.startswith('#') or next_move.startswith('#'):
-                i += 1
-                continue
-                
-            # Check if they're moves on the same face
-            if len(current) > 0 and len(next_move) > 0:
-                current_face = current[0]
-                next_face = next_move[0]
-                
-                # Handle two-character face names
-                if len(current) > 1 and not current[1] in ["'", "2"]:
-                    current_face += current[1]
-                if len(next_move) > 1 and not next_move[1] in ["'", "2"]:
-                    next_face += next_move[1]
-                    
-                if current_face == next_face:
-                    # Determine the combined move
-                    combined = MoveNotation._combine_moves(current, next_move)
-                    if combined:
-                        moves[i] = combined
-                        moves.pop(i + 1)
-                        continue
-            
-            i += 1
-            
-        return moves
+        # Single forward pass with a stack: when the stack top and the
+        # incoming move form a known same-face pair, pop, combine and
+        # (if anything remains) push the result. Amortized O(1) per
+        # move instead of the O(n) list.pop(i+1) of the old while loop.
+        # Pairs outside the table — comments, unknown tokens — are kept
+        # unmerged rather than crashing on them.
+        out = []
+        for move in moves:
+            if out and (out[-1], move) in MoveNotation._COMBINE:
+                combined = MoveNotation._combine_moves(out.pop(), move)
+                if combined:
+                    out.append(combined)
+            else:
+                out.append(move)
+        return out
+
+    @staticmethod
+    def _move_face(move):
+        """
+        Extract the face name from a move token.
+
+        Args:
+            move (str): Move in standard notation.
+
+        Returns:
+            str: The face name (one or two characters).
+        """
+        if len(move) > 1 and move[1] not in ["'", "2"]:
+            return move[:2]
+        return move[:1]
     
     @staticmethod
     def _combine_moves(move1, move2):
         """
         Combine two consecutive moves on the same face.
-        
+
         Args:
             move1, move2: Two moves to combine.
-            
+
         Returns:
             str: Combined move, or None if they cancel out.
+
+        Raises:
+            ValueError: If the pair is not two legal moves on one face.
         """
-        # Extract face and modifiers
-        face1 = move1[0]
-        if len(move1) > 1 and not move1[1] in ["'", "2"]:
-            face1 += move1[1]
-            mod1 = move1[len(face1):]
-        else:
-            mod1 = move1[1:]
-            
-        face2 = move2[0]
-        if len(move2) > 1 and not move2[1] in ["'", "2"]:
-            face2 += move2[1]
-            mod2 = move2[len(face2):]
-        else:
-            mod2 = move2[1:]
-            
-        # Calculate combined rotation
-        rot1 = 1  # Clockwise
-        if mod1 == "'":
-            rot1 = 3  # Counter-clockwise (3 quarter turns)
-        elif mod1 == "2":
-            rot1 = 2  # Half turn
-            
-        rot2 = 1  # Clockwise
-        if mod2 == "'":
-            rot2 = 3  # Counter-clockwise
-        elif mod2 == "2":
-            rot2 = 2  # Half turn
-            
-        # Combine rotations (mod 4 for quarter turns)
-        combined_rot = (rot1 + rot2) % 4
-        
-        # Convert back to move notation
-        if combined_rot == 0:
-            return None  # Moves cancel out
-        elif combined_rot == 1:
-            return face1  # Clockwise
-        elif combined_rot == 2:
-            return face1 + "2"  # Half turn
-        else:  # combined_rot == 3
-            return face1 + "'"  # Counter-clockwise
\ No newline at end of file
+        # Single table lookup; the table is built once at import time
+        try:
+            return MoveNotation._COMBINE[(move1, move2)]
+        except KeyError:
+            raise ValueError(
+                f"Cannot combine moves: {move1!r}, {move2!r}") from None
+
+def _build_combine_table():
+    """
+    Precompute the result of combining every same-face move pair.
+
+    Runs the quarter-turn arithmetic once per (modifier, modifier) pair
+    for each face so that _combine_moves never parses move strings at
+    call time.
+
+    Returns:
+        dict: Mapping of (move1, move2) to the combined move string, or
+            None where the pair cancels out.
+    """
+    rotations = {'': 1, "'": 3, '2': 2}
+    notation = {1: '', 2: '2', 3: "'"}
+    table = {}
+    for face in MoveNotation.FACE_NAMES:
+        for mod1, rot1 in rotations.items():
+            for mod2, rot2 in rotations.items():
+                combined_rot = (rot1 + rot2) % 4
+                if combined_rot == 0:
+                    result = None  # Moves cancel out
+                else:
+                    result = face + notation[combined_rot]
+                table[(face + mod1, face + mod2)] = result
+    return table
+
+MoveNotation._COMBINE = _build_combine_table()
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Packed 4-bit array for pattern-database storage.
+
+Pattern-database depths fit in a nibble (0-15 moves), so storing two
+entries per byte halves the resident size of a database — the dominant
+memory cost of a Korf-style solver.
+"""
+
+import numpy as np
+
+class NibbleArray:
+    """Fixed-size array of 4-bit values backed by a uint8 ndarray."""
+
+    def __init__(self, n, fill=0):
+        """
+        Allocate storage for n 4-bit entries.
+
+        Args:
+            n (int): Number of entries.
+            fill (int): Initial value for every entry (0-15).
+        """
+        self.n = n
+        fill &= 0xF
+        self.buf = np.full((n + 1) // 2, fill | (fill << 4), dtype=np.uint8)
+
+    def get(self, i):
+        """
+        Read entry i.
+
+        Args:
+            i (int): Entry index.
+
+        Returns:
+            int: The stored 4-bit value.
+        """
+        return int(self.buf[i >> 1] >> ((i & 1) << 2)) & 0xF
+
+    def set(self, i, v):
+        """
+        Write entry i.
+
+        Args:
+            i (int): Entry index.
+            v (int): Value to store (truncated to 4 bits).
+        """
+        shift = (i & 1) << 2
+        byte = int(self.buf[i >> 1])
+        self.buf[i >> 1] = (byte & ~(0xF << shift)) | ((v & 0xF) << shift)
+
+    def __len__(self):
+        return self.n
+
+    def tofile(self, path):
+        """Write the packed buffer to a file."""
+        self.buf.tofile(path)
+
+    @classmethod
+    def fromfile(cls, path, n):
+        """
+        Load a packed buffer previously written with tofile().
+
+        Args:
+            path (str): File to read.
+            n (int): Number of entries the file holds.
+
+        Returns:
+            NibbleArray: The loaded array.
+        """
+        arr = cls(0)
+        arr.n = n
+        arr.buf = np.fromfile(path, dtype=np.uint8, count=(n + 1) // 2)
+        return arr
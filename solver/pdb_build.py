@@ -0,0 +1,164 @@
+"""
+Pattern-database construction for the Master Kilominx solver.
+
+A pattern database maps the projection of a state onto a subset of
+stickers (e.g. only the corner ring) to the exact number of moves needed
+to restore that subset, computed by breadth-first search outward from
+the solved state. The stored depth never overestimates the full solve
+length, so it is an admissible IDA* heuristic. Depths are nibble-packed
+on disk and the database is built once and reloaded on later runs.
+"""
+
+import os
+from collections import deque
+
+import numpy as np
+
+from solver.ida_star import MOVE_PERMS, SOLVED_FLAT
+from solver.kilominx_model import NUM_FACES, STICKERS_PER_FACE
+from solver.nibble_array import NibbleArray
+
+def _ring_pattern(ring_start):
+    """Global sticker indices of one 5-sticker ring across all 12 faces."""
+    faces = np.arange(NUM_FACES, dtype=np.int16)[:, None] * STICKERS_PER_FACE
+    return (faces + np.arange(ring_start, ring_start + 5, dtype=np.int16)).reshape(-1)
+
+# Standard pattern projections: one ring of every face
+CORNER_PATTERN = _ring_pattern(0)
+EDGE_PATTERN = _ring_pattern(5)
+MIDDLE_EDGE_PATTERN = _ring_pattern(10)
+
+class PatternDatabase:
+    """Exact-depth lookup table for one sticker-pattern projection."""
+
+    def __init__(self, pattern):
+        """
+        Initialize an empty database for the given projection.
+
+        Args:
+            pattern (ndarray): Global sticker indices the database tracks.
+        """
+        self.pattern = np.asarray(pattern, dtype=np.int16)
+        self.depths = {}
+        # Restricted permutations: how each move rearranges just the
+        # pattern positions. Valid because every move maps each ring
+        # onto the same ring.
+        self._perms = self._restrict_moves()
+
+    def _restrict_moves(self):
+        """
+        Restrict the global move permutations to the pattern positions.
+
+        Returns:
+            ndarray: int16[N_MOVES, len(pattern)] restricted permutations.
+
+        Raises:
+            ValueError: If a move would pull a sticker from outside the
+                pattern (the projection is not closed under the move set).
+        """
+        position_of = {int(g): i for i, g in enumerate(self.pattern)}
+        restricted = np.empty((MOVE_PERMS.shape[0], self.pattern.shape[0]),
+                              dtype=np.int16)
+        for mid in range(MOVE_PERMS.shape[0]):
+            for i, g in enumerate(self.pattern):
+                source = int(MOVE_PERMS[mid, g])
+                if source not in position_of:
+                    raise ValueError(
+                        "Pattern is not closed under the move set"
+                    )
+                restricted[mid, i] = position_of[source]
+        return restricted
+
+    def build(self, max_depth=15, max_states=2_000_000):
+        """
+        Fill the database by BFS from the solved pattern.
+
+        Args:
+            max_depth (int): Deepest level to expand (15 is the nibble cap).
+            max_states (int): Safety limit on stored entries.
+        """
+        solved = SOLVED_FLAT[self.pattern]
+        self.depths = {solved.tobytes(): 0}
+        frontier = deque([solved])
+        depth = 0
+        while frontier and depth < max_depth and len(self.depths) < max_states:
+            depth += 1
+            for _ in range(len(frontier)):
+                state = frontier.popleft()
+                for mid in range(self._perms.shape[0]):
+                    child = state[self._perms[mid]]
+                    key = child.tobytes()
+                    if key not in self.depths:
+                        self.depths[key] = depth
+                        frontier.append(child)
+
+    def lookup(self, flat):
+        """
+        Heuristic depth for a full flat state.
+
+        Args:
+            flat (ndarray): Flat uint8[240] state buffer.
+
+        Returns:
+            int: Stored distance for the state's pattern projection, or 0
+                when the projection was never reached (keeps the bound
+                admissible).
+        """
+        return self.depths.get(flat[self.pattern].tobytes(), 0)
+
+    def save(self, path):
+        """
+        Persist the database with nibble-packed depths.
+
+        Args:
+            path (str): Destination file (.npz).
+        """
+        n = len(self.depths)
+        keys = np.empty((n, self.pattern.shape[0]), dtype=np.uint8)
+        packed = NibbleArray(n)
+        for i, (key, depth) in enumerate(self.depths.items()):
+            keys[i] = np.frombuffer(key, dtype=np.uint8)
+            packed.set(i, depth)
+        np.savez_compressed(path, pattern=self.pattern, keys=keys,
+                            depths=packed.buf, count=n)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a database previously written by save().
+
+        Args:
+            path (str): Source file (.npz).
+
+        Returns:
+            PatternDatabase: The loaded database.
+        """
+        with np.load(path) as data:
+            db = cls(data["pattern"])
+            keys = data["keys"]
+            n = int(data["count"])
+            packed = NibbleArray(n)
+            packed.buf = data["depths"].copy()
+            db.depths = {
+                keys[i].tobytes(): packed.get(i) for i in range(n)
+            }
+        return db
+
+def build_or_load(pattern, path, max_depth=15):
+    """
+    Load a pattern database from disk, building and saving it if absent.
+
+    Args:
+        pattern (ndarray): Global sticker indices to track.
+        path (str): Cache file location (.npz).
+        max_depth (int): BFS depth limit when building.
+
+    Returns:
+        PatternDatabase: The ready database.
+    """
+    if os.path.exists(path):
+        return PatternDatabase.load(path)
+    db = PatternDatabase(pattern)
+    db.build(max_depth=max_depth)
+    db.save(path)
+    return db
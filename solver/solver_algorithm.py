@@ -8,20 +8,56 @@ This implements a reduction-based solving method, which:
 """
 
 from solver.kilominx_model import MasterKilominx, Face
+from solver.ida_star import (
+    ida_star, HAVE_NUMBA, MOVE_NAMES, MOVE_PERMS,
+    LEGAL_NEXT, LEGAL_COUNT, _heuristic, _FOUND
+)
+from solver.symmetry import canonical_key
+from collections import OrderedDict
 import random
 
 class MasterKilominxSolver:
     """Solver class for the Master Kilominx puzzle."""
-    
+
+    # Transposition table capacity; oldest entries are evicted beyond this
+    TT_MAX_ENTRIES = 1 << 22
+
     def __init__(self, initial_state):
         """
         Initialize the solver with a puzzle state.
-        
+
         Args:
             initial_state (dict): The initial state of the puzzle.
         """
         self.cube = MasterKilominx(initial_state)
         self.solution = []
+        # Bounded transposition table for the IDA* search: maps a state
+        # key to (bound_failed, g_used) so revisits of the same state at
+        # equal-or-worse depth under an already-failed bound are pruned.
+        self.tt = OrderedDict()
+        # Optional pattern databases consulted by the search heuristic
+        self.pdbs = []
+
+    def load_pattern_database(self, pattern, path, max_depth=15):
+        """
+        Attach a pattern database, building and caching it if needed.
+
+        Args:
+            pattern (ndarray): Global sticker indices to track.
+            path (str): Cache file location (.npz).
+            max_depth (int): BFS depth limit when building.
+        """
+        from solver.pdb_build import build_or_load
+        self.pdbs.append(build_or_load(pattern, path, max_depth=max_depth))
+
+    def _heuristic_with_pdbs(self, flat):
+        """Max of the sticker-count bound and all attached databases."""
+        h = _heuristic(flat)
+        for pdb in self.pdbs:
+            depth = pdb.lookup(flat)
+            if depth > h:
+                h = depth
+        return h
         
     def solve(self):
         """
@@ -46,6 +82,87 @@ class MasterKilominxSolver:
         
         return self.solution
         
+    def solve_optimal(self, max_depth=14):
+        """
+        Find an optimal solution via IDA* search.
+
+        Unlike the reduction method in solve(), this searches for a
+        shortest move sequence. The search kernel operates on flat
+        arrays and is JIT-compiled with Numba when it is installed;
+        depth is capped since the pure-Python fallback is slow.
+
+        Args:
+            max_depth (int): Maximum solution length to search for.
+
+        Returns:
+            list or None: Optimal move sequence, or None if no solution
+                was found within max_depth.
+        """
+        if HAVE_NUMBA:
+            # The jitted kernel explores nodes fast enough that table
+            # maintenance would cost more than the pruning saves.
+            return ida_star(self.cube, max_depth=max_depth)
+
+        # Pure-Python fallback: memoize visited states so isomorphic
+        # subproblems are not re-expanded within a bound.
+        flat = self.cube.state.reshape(-1)
+        bound = self._heuristic_with_pdbs(flat)
+        path = []
+        while bound <= max_depth:
+            result = self._search_memo(flat, 0, bound, -1, path)
+            if result == _FOUND:
+                return [MOVE_NAMES[mid] for mid in path]
+            bound = result
+        return None
+
+    def _search_memo(self, flat, g, bound, prev_move, path):
+        """
+        Cost-bounded DFS with transposition-table pruning.
+
+        Args:
+            flat: Flat uint8 state buffer.
+            g: Moves spent so far.
+            bound: Current IDA* f-cost bound.
+            prev_move: Move id that produced `flat` (-1 at the root).
+            path: Move-id list, extended in place with the solution.
+
+        Returns:
+            _FOUND on success, otherwise the minimum f-cost over the bound.
+        """
+        h = self._heuristic_with_pdbs(flat)
+        if h == 0:
+            return _FOUND
+        f = g + h
+        if f > bound:
+            return f
+        # Hash the orbit representative so symmetric states share entries
+        key = canonical_key(flat)
+        entry = self.tt.get(key)
+        if entry is not None and entry[1] <= g and entry[0] >= bound:
+            # Already failed from this state at no-worse depth and bound
+            return bound + 1
+        min_next = float("inf")
+        row = prev_move + 1
+        for k in range(LEGAL_COUNT[row]):
+            mid = int(LEGAL_NEXT[row, k])
+            child = flat[MOVE_PERMS[mid]]
+            path.append(mid)
+            result = self._search_memo(child, g + 1, bound, mid, path)
+            if result == _FOUND:
+                return _FOUND
+            path.pop()
+            if result < min_next:
+                min_next = result
+        self._tt_store(key, g, bound)
+        return min_next
+
+    def _tt_store(self, key, g, bound):
+        """Record a failed expansion, evicting the oldest entry if full."""
+        self.tt[key] = (bound, g)
+        self.tt.move_to_end(key)
+        if len(self.tt) > self.TT_MAX_ENTRIES:
+            self.tt.popitem(last=False)
+
     def _solve_centers(self):
         """
         Solve the center pieces of each face.
@@ -4,92 +4,131 @@ Corrected to validate 20 stickers per face (excluding the black center mechanism
 """
 
 from collections import Counter
+from itertools import chain
+import numpy as np
 from solver.kilominx_model import MasterKilominx
 
-def validate_kilominx_state(state):
+def validate_kilominx_state(state, stickers_per_face=None):
     """
     Validate if a Master Kilominx state is valid and solvable.
-    
+
     Args:
         state (dict): The state to validate, mapping face indices to sticker color lists.
-        
+        stickers_per_face (int, optional): Expected sticker count per face.
+            Derived from the first face when omitted, so the same
+            validator handles both 16- and 20-sticker representations.
+
     Returns:
         tuple: (is_valid, message) where is_valid is a boolean and message explains any issues.
     """
     # 1. Check if we have the right number of faces
     if len(state) != 12:
         return False, f"Invalid number of faces: {len(state)}. Expected 12 faces."
-    
-    # 2. Check if each face has exactly 20 stickers
-    # Each face has 5 groups of 4 stickers each (the black center is not counted)
+
+    if stickers_per_face is None:
+        stickers_per_face = len(next(iter(state.values())))
+
+    # 2. Check if each face has exactly stickers_per_face stickers
+    # (the black center mechanism is never counted)
     for face_idx, stickers in state.items():
-        if len(stickers) != 20:
-            return False, f"Face {face_idx} has {len(stickers)} stickers. Expected 20 stickers."
-    
-    # 3. Count the number of stickers of each color
-    all_stickers = []
-    for stickers in state.values():
-        all_stickers.extend(stickers)
-    
-    # Group stickers by color
-    color_counter = {}
-    
-    # Handle different color representations
-    for sticker in all_stickers:
-        # Convert the color to a hashable representation
-        if isinstance(sticker, (list, tuple)):
-            # For RGB values, convert to tuple for hashing
-            color_key = tuple(sticker)
-        else:
-            color_key = sticker
-            
-        color_counter[color_key] = color_counter.get(color_key, 0) + 1
-    
+        if len(stickers) != stickers_per_face:
+            return False, (f"Face {face_idx} has {len(stickers)} stickers. "
+                           f"Expected {stickers_per_face} stickers.")
+
+    # 3. Count the number of stickers of each color in one vectorized
+    # pass: normalizing to an array up front removes the per-sticker
+    # isinstance/tuple dispatch entirely.
+    arr = np.asarray(list(state.values()))
+    if arr.ndim == 3:
+        # RGB triples: unique rows of the flattened (n, 3) array
+        unique, counts = np.unique(arr.reshape(-1, arr.shape[-1]),
+                                   axis=0, return_counts=True)
+    else:
+        # Scalar color values
+        unique, counts = np.unique(arr.reshape(-1), return_counts=True)
+
     # Check if we have the correct number of unique colors
-    if len(color_counter) != 12:
-        return False, f"Found {len(color_counter)} colors. Expected 12 colors."
-    
-    # Check if each color appears exactly 20 times
-    for color, count in color_counter.items():
-        if count != 20:
-            color_str = str(color)
-            return False, f"Color {color_str} appears {count} times. Expected 20 occurrences."
-    
+    if unique.shape[0] != 12:
+        return False, f"Found {unique.shape[0]} colors. Expected 12 colors."
+
+    # Check if each color appears exactly once per face
+    if not (counts == stickers_per_face).all():
+        bad = int(np.argmax(counts != stickers_per_face))
+        color_str = str(tuple(unique[bad].tolist()) if unique.ndim == 2
+                        else unique[bad])
+        return False, (f"Color {color_str} appears {int(counts[bad])} times. "
+                       f"Expected {stickers_per_face} occurrences.")
+
     # If all checks pass, the state is valid
     return True, "The cube state is valid."
 
-def check_color_distribution(state):
+def check_center_consistency(state):
+    """
+    Check that each face's center-edge ring is uniformly colored.
+
+    Only meaningful for states expected to have coherent centers (e.g.
+    after the reduction step); a legally scrambled cube will fail this.
+
+    Args:
+        state (dict): The state to check, with RGB sticker lists.
+
+    Returns:
+        tuple: (is_valid, message)
+    """
+    arr = np.asarray(list(state.values()))
+    if arr.ndim != 3 or arr.shape[1] < 20:
+        return True, "Center consistency check skipped (not a 20-sticker RGB state)."
+
+    # One vectorized comparison across all 12 faces: every sticker in
+    # the center ring (indices 15-19) must match the ring's first sticker
+    ok = np.all(arr[:, 15:20, :] == arr[:, 15:16, :], axis=(1, 2))
+    if not ok.all():
+        bad = int(np.argmin(ok))
+        face_idx = list(state.keys())[bad]
+        return False, f"Face {face_idx} has inconsistent center colors."
+
+    return True, "Center colors are consistent."
+
+def check_color_distribution(state, stickers_per_face=None):
     """
     Check if the color distribution in the state is valid.
-    
+
     Args:
         state (dict): The state to validate.
-        
+        stickers_per_face (int, optional): Expected count per color.
+            Derived from the first face when omitted.
+
     Returns:
         tuple: (is_valid, message)
     """
-    # Flatten all stickers
-    all_stickers = []
-    for stickers in state.values():
-        all_stickers.extend(stickers)
-    
-    # Count occurrences of each color
-    # Convert non-hashable types (like lists) to tuples
-    hashable_stickers = []
-    for sticker in all_stickers:
-        if isinstance(sticker, list):
-            hashable_stickers.append(tuple(sticker))
-        else:
-            hashable_stickers.append(sticker)
-    
-    color_counts = Counter(hashable_stickers)
-    
-    # A Master Kilominx should have 12 colors with 20 stickers each
-    expected_count = 20
-    
-    # Check if each color appears the expected number of times
-    for color, count in color_counts.items():
-        if count != expected_count:
-            return False, f"Color {str(color)} appears {count} times (expected {expected_count})"
-    
+    if stickers_per_face is None and state:
+        stickers_per_face = len(next(iter(state.values())))
+
+    # Count occurrences of each color in one pass, flattening lazily
+    # with chain.from_iterable so no intermediate list is materialized.
+    # The representation is uniform, so detect it from the first sticker
+    # once; map(tuple, ...) then converts inside Counter's C loop.
+    first_face = next(iter(state.values()), [])
+    flat = chain.from_iterable(state.values())
+    if first_face and isinstance(first_face[0], list):
+        color_counts = Counter(map(tuple, flat))
+    else:
+        color_counts = Counter(flat)
+
+    # A Master Kilominx should have 12 colors, each covering one face
+    expected_count = stickers_per_face
+
+    # Fast path: a valid distribution has exactly one distinct count,
+    # so a single C-level set comparison accepts it without touching
+    # individual entries
+    if set(color_counts.values()) == {expected_count}:
+        return True, "Color distribution is valid"
+
+    # Slow path, only reached on invalid input: find the first color
+    # whose count is off for the error message
+    bad = next(((c, n) for c, n in color_counts.items() if n != expected_count),
+               None)
+    if bad is not None:
+        return False, f"Color {str(bad[0])} appears {bad[1]} times (expected {expected_count})"
+
     return True, "Color distribution is valid"
\ No newline at end of file
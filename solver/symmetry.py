@@ -0,0 +1,74 @@
+"""
+Symmetry reduction for Master Kilominx search states.
+
+The dodecahedron has 60 rotational symmetries; hashing the
+lexicographically minimal representative of a state's orbit instead of
+the state itself collapses symmetric subproblems in the transposition
+table and shrinks pattern databases by up to the group order.
+
+Each symmetry is a 240-element sticker permutation (conjugation by
+rotating the whole puzzle). The SYMS table currently holds only the
+identity: the other 59 rotations permute stickers across faces, so they
+can only be tabulated once the full dodecahedral adjacency geometry is
+defined in the move engine. The canonicalization below already handles
+an arbitrary table.
+"""
+
+import numpy as np
+
+from solver.kilominx_model import NUM_FACES, STICKERS_PER_FACE
+
+_TOTAL = NUM_FACES * STICKERS_PER_FACE
+
+def _build_symmetries(generators=()):
+    """
+    Close a set of generator permutations into a symmetry table.
+
+    Args:
+        generators (iterable): int permutation arrays of length 240.
+
+    Returns:
+        ndarray: int16[n_syms, 240] table; row 0 is the identity.
+    """
+    identity = np.arange(_TOTAL, dtype=np.int16)
+    seen = {identity.tobytes(): identity}
+    frontier = [identity]
+    while frontier:
+        current = frontier.pop()
+        for gen in generators:
+            composed = current[np.asarray(gen, dtype=np.int16)]
+            key = composed.tobytes()
+            if key not in seen:
+                seen[key] = composed
+                frontier.append(composed)
+    return np.stack(sorted(seen.values(), key=lambda p: p.tobytes()))
+
+# Whole-puzzle rotation permutations; identity-only until the adjacency
+# tables provide the rotation generators.
+SYMS = _build_symmetries()
+
+def canonical_key(flat):
+    """
+    Get the lexicographically minimal representative of a state's orbit.
+
+    Scans position by position, keeping only the symmetries still
+    attaining the minimum so far, so the full conjugate is materialized
+    for few symmetries rather than all of them.
+
+    Args:
+        flat (ndarray): Flat uint8[240] state buffer.
+
+    Returns:
+        bytes: The minimal conjugated state, suitable as a hash key.
+    """
+    n_syms = SYMS.shape[0]
+    if n_syms == 1:
+        return flat.tobytes()
+    candidates = list(range(n_syms))
+    for pos in range(_TOTAL):
+        values = [flat[SYMS[g, pos]] for g in candidates]
+        best = min(values)
+        candidates = [g for g, v in zip(candidates, values) if v == best]
+        if len(candidates) == 1:
+            break
+    return flat[SYMS[candidates[0]]].tobytes()
@@ -0,0 +1,65 @@
+"""
+Unit tests for the manual color picker's cube-state round trip.
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from ui.color_picker import MasterKilominxColorPicker
+
+class TestColorPickerState(unittest.TestCase):
+    """Test cases for apply_cube_state/get_cube_state."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication required by Qt widgets once."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.picker = MasterKilominxColorPicker(lambda state: None)
+
+    def test_round_trip_20_sticker_state(self):
+        """A full 20-sticker state survives the round trip unchanged."""
+        state = {
+            f"face_{i}": [[i * 10, 50, 100] for _ in range(20)]
+            for i in range(12)
+        }
+
+        self.picker.apply_cube_state(state)
+        self.assertEqual(self.picker.get_cube_state(), state)
+
+    def test_apply_16_sticker_image_state(self):
+        """Image-pipeline states (16 stickers per face) must not raise.
+
+        extract_grid_colors returns 4x4 grids, so apply_cube_state has
+        to pad the remaining slots with the placeholder gray instead of
+        broadcasting 16 rows into a 20-row face.
+        """
+        state = {
+            f"face_{i}": [[i * 10, 50, 100] for _ in range(16)]
+            for i in range(12)
+        }
+
+        self.picker.apply_cube_state(state)
+        result = self.picker.get_cube_state()
+
+        for i in range(12):
+            face = result[f"face_{i}"]
+            self.assertEqual(face[:16], state[f"face_{i}"])
+            self.assertEqual(face[16:], [[200, 200, 200]] * 4)
+
+    def test_apply_oversized_face_truncates(self):
+        """Faces with more than 20 stickers are truncated, not rejected."""
+        state = {"face_0": [[1, 2, 3]] * 24}
+
+        self.picker.apply_cube_state(state)
+        face = self.picker.get_cube_state()["face_0"]
+
+        self.assertEqual(face, [[1, 2, 3]] * 20)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Unit tests for the solver core: move application, notation, storage.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from solver.kilominx_model import MasterKilominx
+from solver.move_notation import MoveNotation
+from solver.nibble_array import NibbleArray
+
+class TestKilominxModel(unittest.TestCase):
+    """Test cases for move application on the cube model."""
+
+    ALGORITHM = ["R", "U'", "BR2", "F", "L'"]
+
+    @staticmethod
+    def _distinct_cube():
+        """Build a cube with every sticker value distinct.
+
+        The move tables currently only rotate on-face rings, which is
+        invisible on a solved (uniform-face) cube; distinct values make
+        any permutation observable.
+        """
+        return MasterKilominx(np.arange(240, dtype=np.uint8).reshape(12, 20))
+
+    def test_apply_undo_round_trip(self):
+        """Undoing applied moves in reverse restores the exact state."""
+        cube = self._distinct_cube()
+        before = cube.state.copy()
+
+        for move in self.ALGORITHM:
+            cube.apply_move_inplace(move)
+        self.assertFalse(np.array_equal(cube.state, before),
+                         "Scramble left the state unchanged")
+
+        for move in reversed(self.ALGORITHM):
+            cube.undo_move(move)
+        self.assertTrue(np.array_equal(cube.state, before),
+                        "Undo did not restore the original state")
+
+    def test_apply_algorithm_matches_sequential_moves(self):
+        """The fused algorithm gather equals one-move-at-a-time application."""
+        cube = self._distinct_cube()
+
+        fused = cube.apply_algorithm(self.ALGORITHM)
+        sequential = cube
+        for move in self.ALGORITHM:
+            sequential = sequential.apply_move(move)
+
+        self.assertTrue(np.array_equal(fused.state, sequential.state))
+
+    def test_apply_algorithm_ignores_comments(self):
+        """Comment tokens in algorithm strings do not affect the result."""
+        cube = self._distinct_cube()
+
+        commented = cube.apply_algorithm("R U # setup phase\nF")
+        plain = cube.apply_algorithm("R U F")
+
+        self.assertTrue(np.array_equal(commented.state, plain.state))
+
+    def test_apply_algorithm_rejects_unknown_move(self):
+        """Unknown tokens raise ValueError, not a bare KeyError."""
+        cube = MasterKilominx()
+
+        with self.assertRaises(ValueError):
+            cube.apply_algorithm("R X2 U")
+
+class TestMoveNotation(unittest.TestCase):
+    """Test cases for algorithm parsing and simplification."""
+
+    def test_simplify_merges_same_face_moves(self):
+        """Consecutive same-face moves combine into one."""
+        self.assertEqual(MoveNotation.simplify_algorithm(["R", "R"]), ["R2"])
+        self.assertEqual(MoveNotation.simplify_algorithm(["R2", "R"]), ["R'"])
+
+    def test_simplify_cancels_inverse_pairs(self):
+        """Inverse pairs drop out entirely, cascading through the stack."""
+        self.assertEqual(MoveNotation.simplify_algorithm(["R", "R'"]), [])
+        self.assertEqual(MoveNotation.simplify_algorithm(["R", "R'", "U"]),
+                         ["U"])
+        self.assertEqual(
+            MoveNotation.simplify_algorithm(["F", "R", "R'", "F'"]), [])
+
+    def test_simplify_keeps_unknown_tokens(self):
+        """Tokens outside the move alphabet pass through unmerged."""
+        self.assertEqual(MoveNotation.simplify_algorithm(["X", "X"]),
+                         ["X", "X"])
+        self.assertEqual(
+            MoveNotation.simplify_algorithm(["R", "# note", "R"]),
+            ["R", "# note", "R"])
+
+    def test_parse_preserves_unknown_tokens(self):
+        """A typo survives parsing so it can be diagnosed downstream."""
+        self.assertEqual(MoveNotation.parse_algorithm("X2 R"), ["X2", "R"])
+        self.assertEqual(
+            MoveNotation.parse_algorithm("F U' BR2 # wide turn\nR"),
+            ["F", "U'", "BR2", "# wide turn", "R"])
+
+class TestNibbleArray(unittest.TestCase):
+    """Test cases for the packed 4-bit array."""
+
+    def test_get_set_round_trip(self):
+        """Values written to even and odd slots read back unchanged."""
+        arr = NibbleArray(10, fill=15)
+        self.assertEqual([arr.get(i) for i in range(10)], [15] * 10)
+
+        for i in range(10):
+            arr.set(i, i)
+        self.assertEqual([arr.get(i) for i in range(10)], list(range(10)))
+        self.assertEqual(len(arr), 10)
+
+    def test_file_round_trip(self):
+        """tofile/fromfile reproduce the array contents exactly."""
+        arr = NibbleArray(9)
+        for i in range(9):
+            arr.set(i, (i * 3) & 0xF)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "depths.nib")
+            arr.tofile(path)
+            loaded = NibbleArray.fromfile(path, 9)
+
+        self.assertEqual([loaded.get(i) for i in range(9)],
+                         [arr.get(i) for i in range(9)])
+
+if __name__ == "__main__":
+    unittest.main()
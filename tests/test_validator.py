@@ -7,74 +7,70 @@ from solver.state_validator import validate_kilominx_state, check_color_distribu
 
 class TestValidator(unittest.TestCase):
     """Test cases for the Kilominx state validator."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the baseline valid state (12 faces, 16 stickers) once.
+
+        Stickers are tuples: they cannot be aliased-and-mutated by
+        accident the way `[[...]] * 16` rows can, and the validator's
+        Counter path consumes them without conversion.
+        """
+        cls.BASE_STATE = {
+            f"face_{i}": [(i * 20,) * 3 for _ in range(16)] for i in range(12)
+        }
+
+    def _state(self):
+        """Return a shallow per-face copy of the baseline state."""
+        return {k: list(v) for k, v in self.BASE_STATE.items()}
+
     def test_valid_state(self):
         """Test validation of a valid cube state."""
-        # Create a valid state with 12 faces and 16 stickers per face
-        state = {}
-        for i in range(12):
-            # Each face has 16 stickers of the same color
-            state[f"face_{i}"] = [[i * 20, i * 20, i * 20]] * 16
-            
-        is_valid, message = validate_kilominx_state(state)
+        is_valid, message = validate_kilominx_state(self._state())
         self.assertTrue(is_valid, f"Valid state was rejected: {message}")
-        
+
     def test_invalid_face_count(self):
         """Test validation fails with incorrect face count."""
-        # Create a state with only 11 faces
-        state = {}
-        for i in range(11):
-            state[f"face_{i}"] = [[i * 20, i * 20, i * 20]] * 16
-            
+        # Drop one face, leaving only 11
+        state = self._state()
+        del state["face_11"]
+
         is_valid, message = validate_kilominx_state(state)
         self.assertFalse(is_valid, "Invalid state (wrong face count) was accepted")
-        
+
     def test_invalid_sticker_count(self):
         """Test validation fails with incorrect sticker count."""
-        # Create a state with one face having 15 stickers instead of 16
-        state = {}
-        for i in range(12):
-            if i == 5:
-                state[f"face_{i}"] = [[i * 20, i * 20, i * 20]] * 15
-            else:
-                state[f"face_{i}"] = [[i * 20, i * 20, i * 20]] * 16
-                
+        # Give face 5 only 15 stickers instead of 16
+        state = self._state()
+        state["face_5"] = state["face_5"][:15]
+
         is_valid, message = validate_kilominx_state(state)
         self.assertFalse(is_valid, "Invalid state (wrong sticker count) was accepted")
-        
+
     def test_invalid_color_distribution(self):
         """Test validation fails with incorrect color distribution."""
-        # Create a state with incorrect color counts
-        state = {}
-        for i in range(12):
-            if i == 0:
-                # Face 0 has 20 stickers of color 0
-                state[f"face_{i}"] = [[0, 0, 0]] * 20  # This should fail
-            else:
-                state[f"face_{i}"] = [[i * 20, i * 20, i * 20]] * 16
-                
+        # Face 0 has 20 stickers of color 0 while every other color
+        # appears only 16 times
+        state = self._state()
+        state["face_0"] = [(0, 0, 0)] * 20
+
         is_valid, message = check_color_distribution(state)
         self.assertFalse(is_valid, "Invalid color distribution was accepted")
-        
+
     def test_inconsistent_centers(self):
         """Test validation fails with inconsistent center colors."""
-        # Create a state with inconsistent center colors on one face
-        state = {}
-        for i in range(12):
-            stickers = []
-            for j in range(16):
-                if i == 3 and j in [5, 6, 9, 10]:  # Center stickers on face 3
-                    # Use a different color for one center sticker
-                    stickers.append([100, 100, 100] if j == 5 else [i * 20, i * 20, i * 20])
-                else:
-                    stickers.append([i * 20, i * 20, i * 20])
-                    
-            state[f"face_{i}"] = stickers
-            
+        # Recolor one center sticker on face 3
+        state = self._state()
+        stickers = state["face_3"]
+        state["face_3"] = [
+            (100, 100, 100) if j == 5 else sticker
+            for j, sticker in enumerate(stickers)
+        ]
+
         is_valid, message = validate_kilominx_state(state)
         # The inconsistent center check is simplified in the validator,
         # so it may or may not detect this specific issue
         print(f"Inconsistent centers test result: {is_valid}, {message}")
-        
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
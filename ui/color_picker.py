@@ -3,165 +3,231 @@ Widget for manually inputting the colors of the Master Kilominx faces.
 Layout: Small black pentagon center (mechanism) + 5 edge pieces with 4 stickers each = 20 stickers.
 """
 
-from PyQt5.QtWidgets import (QWidget, QGridLayout, QPushButton, QComboBox,
-                           QLabel, QVBoxLayout, QHBoxLayout, QGroupBox,
-                           QScrollArea, QSizePolicy, QFrame)
-from PyQt5.QtGui import QColor, QPalette, QPainter, QPolygon, QPainterPath, QPen
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint
+from PyQt5.QtWidgets import (QWidget, QGridLayout, QPushButton, QToolButton,
+                           QButtonGroup, QLabel, QVBoxLayout, QHBoxLayout,
+                           QGroupBox)
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+import functools
 import math
+import numpy as np
 
-class PentagonalSticker(QPushButton):
-    """Button representing a sticker on the Kilominx pentagonal face."""
-    
-    def __init__(self, edge_id, sticker_id, parent=None):
-        super().__init__(parent)
-        self.edge_id = edge_id      # 0-4 for the five edges
-        self.sticker_id = sticker_id  # 0-3 for the four stickers on each edge
-        self.setFixedSize(30, 30)
-        self.setColor(QColor(200, 200, 200))  # Default gray
-        
-    def setColor(self, color):
-        """Set the button's color."""
-        self.color = color
-        palette = self.palette()
-        palette.setColor(QPalette.Button, color)
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
-        self.update()
-        
-    def getColor(self):
-        """Get the button's current color."""
-        return self.color
-
-class PentagonWidget(QWidget):
-    """Widget that displays a small black pentagon in the center."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setFixedSize(50, 50)  # Smaller size
-        
-    def paintEvent(self, event):
-        """Draw a black pentagon."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Set black fill and no outline for the pentagon
-        painter.setBrush(QColor(0, 0, 0))  # Pure black
-        painter.setPen(Qt.NoPen)  # No outline
-        
-        # Create a pentagon
-        center = QPoint(25, 25)
-        radius = 20  # Smaller radius
-        
-        pentagon_path = QPainterPath()
-        for i in range(5):
-            angle = i * 2 * math.pi / 5 - math.pi / 2
-            x = center.x() + radius * math.cos(angle)
-            y = center.y() + radius * math.sin(angle)
-            
-            if i == 0:
-                pentagon_path.moveTo(x, y)
-            else:
-                pentagon_path.lineTo(x, y)
-        
-        pentagon_path.closeSubpath()
-        painter.drawPath(pentagon_path)
+# Direction cosines for the five pentagon vertices (starting at the top)
+# and for the midpoints between consecutive vertices. Computed once at
+# import instead of per face widget.
+_PENT_COS = tuple(math.cos(i * 2 * math.pi / 5 - math.pi / 2) for i in range(5))
+_PENT_SIN = tuple(math.sin(i * 2 * math.pi / 5 - math.pi / 2) for i in range(5))
+_PENT_MID_COS = tuple(math.cos((i + 0.5) * 2 * math.pi / 5 - math.pi / 2) for i in range(5))
+_PENT_MID_SIN = tuple(math.sin((i + 0.5) * 2 * math.pi / 5 - math.pi / 2) for i in range(5))
+
+# Qt enum value resolved once at import; each use otherwise pays an
+# attribute lookup through the PyQt wrapper
+_NO_PEN = Qt.NoPen
+
+# Static paint resources shared by every repaint: the sticker outline
+# pen and the center-pentagon fill
+_GRID_PEN = QPen(QColor(60, 60, 60))
+_BLACK_BRUSH = QBrush(Qt.black)
+
+@functools.lru_cache(maxsize=64)
+def _button_qss(rgb):
+    """Stylesheet for a colored button, cached per 24-bit RGB value."""
+    return "QPushButton{background-color:#%06x;border:1px solid #444}" % rgb
 
 class PentagonalFaceWidget(QWidget):
-    """Widget representing a pentagonal face with 5 edges, 4 stickers per edge."""
-    
-    def __init__(self, face_id, on_sticker_clicked_callback, parent=None):
+    """
+    Widget representing a pentagonal face with 5 edges, 4 stickers per edge.
+
+    The whole face is one widget: all 20 stickers and the black center
+    pentagon are drawn in a single paintEvent from a shared colors
+    array, and clicks are resolved by hit-testing against the sticker
+    position table. This replaces the earlier design of one QPushButton
+    per sticker (240 widgets across 12 faces) with 12 flat widgets.
+    """
+
+    # Sticker square size in pixels
+    _STICKER_SIZE = 30
+
+    # Shared (edge_id, sticker_id, x, y) sticker position table, computed
+    # on first use and reused by all 12 face widgets
+    _POSITIONS = None
+
+    # Shared path for the central black pentagon mechanism, built lazily
+    _PENTAGON_PATH = None
+
+    # Pixel-to-sticker lookup table (uint8[400, 400], 255 = no sticker),
+    # built lazily and shared by all faces
+    _HITMAP = None
+
+    def __init__(self, face_id, on_sticker_clicked_callback, colors, parent=None):
+        """
+        Args:
+            face_id (int): Face index (0-11).
+            on_sticker_clicked_callback: Called with (face_id, edge_id,
+                sticker_id) when a sticker is clicked.
+            colors (ndarray): uint8[20, 3] view of this face's sticker
+                colors; the widget paints directly from it.
+        """
         super().__init__(parent)
         self.face_id = face_id
         self.on_sticker_clicked = on_sticker_clicked_callback
-        self.stickers = []
-        self.setMinimumSize(400, 400)
-        self._setup_pentagonal_layout()
-    
-    def _setup_pentagonal_layout(self):
-        """Create the Master Kilominx layout with 20 stickers."""
-        layout = QVBoxLayout(self)
-        
-        # Create a container for absolute positioning
-        container = QWidget()
-        container.setFixedSize(400, 400)
-        layout.addWidget(container)
-        
-        # Center of the pentagon
+        self._colors = colors
+        self.setFixedSize(400, 400)
+
+    def show_face(self, face_id, colors):
+        """
+        Retarget this widget at another face.
+
+        One widget serves all 12 faces: switching swaps the face id and
+        the colors view and schedules a single repaint.
+
+        Args:
+            face_id (int): Face index (0-11).
+            colors (ndarray): uint8[20, 3] view of that face's colors.
+        """
+        self.face_id = face_id
+        self._colors = colors
+        self.update()
+
+    @classmethod
+    def _compute_positions(cls):
+        """
+        Compute the 20 sticker positions for a 400x400 face, once.
+
+        Each edge places 4 stickers in a trapezoidal pattern, outside to
+        inside: corner, outer edge, inner edge, center edge. Corner and
+        center stickers sit on the vertex directions, the two edge
+        stickers on the midpoint directions between vertices.
+
+        Returns:
+            tuple: Frozen ((edge_id, sticker_id, x, y), ...) table.
+        """
+        if cls._POSITIONS is not None:
+            return cls._POSITIONS
+
         center_x, center_y = 200, 200
-        
-        # Add the small black pentagon mechanism (visual only, not interactive)
-        pentagon_widget = PentagonWidget(container)
-        pentagon_widget.move(center_x - 25, center_y - 25)  # Center the smaller pentagon
-        
-        # Create 5 edges, each with 4 stickers
+        # Radii for corner, outer edge, inner edge and center edge stickers
+        radii = (170, 140, 100, 60)
+        positions = []
         for edge in range(5):
-            # Each edge is at 72-degree increments
-            angle = edge * 2 * math.pi / 5 - math.pi / 2  # Start from top
-            
-            # For each edge, position 4 stickers in a trapezoidal pattern
-            # Arranged from outside to inside: corner, outer edge, inner edge, center edge
-            
-            # Base positions for this edge
-            base_angle = angle
-            
-            # 1. Corner sticker - outermost point, exactly on pentagon vertex
-            corner_radius = 170
-            corner_x = int(center_x + corner_radius * math.cos(base_angle) - 15)
-            corner_y = int(center_y + corner_radius * math.sin(base_angle) - 15)
-            corner_sticker = PentagonalSticker(edge, 0, container)
-            corner_sticker.move(corner_x, corner_y)
-            corner_sticker.clicked.connect(lambda checked, e=edge, s=0: 
-                                        self.on_sticker_clicked(self.face_id, e, s))
-            self.stickers.append(corner_sticker)
-            
-            # 2. Outer edge sticker - along the pentagon's outer edge
-            edge_radius = 140
-            next_angle = (edge + 1) * 2 * math.pi / 5 - math.pi / 2
-            edge_angle = (base_angle + next_angle) / 2
-            outer_edge_x = int(center_x + edge_radius * math.cos(edge_angle) - 15)
-            outer_edge_y = int(center_y + edge_radius * math.sin(edge_angle) - 15)
-            outer_edge_sticker = PentagonalSticker(edge, 1, container)
-            outer_edge_sticker.move(outer_edge_x, outer_edge_y)
-            outer_edge_sticker.clicked.connect(lambda checked, e=edge, s=1: 
-                                            self.on_sticker_clicked(self.face_id, e, s))
-            self.stickers.append(outer_edge_sticker)
-            
-            # 3. Inner edge sticker - midway between outer edge and center
-            inner_edge_radius = 100
-            inner_edge_x = int(center_x + inner_edge_radius * math.cos(edge_angle) - 15)
-            inner_edge_y = int(center_y + inner_edge_radius * math.sin(edge_angle) - 15)
-            inner_edge_sticker = PentagonalSticker(edge, 2, container)
-            inner_edge_sticker.move(inner_edge_x, inner_edge_y)
-            inner_edge_sticker.clicked.connect(lambda checked, e=edge, s=2: 
-                                            self.on_sticker_clicked(self.face_id, e, s))
-            self.stickers.append(inner_edge_sticker)
-            
-            # 4. Center edge sticker - closest to the central pentagon
-            center_edge_radius = 60  # Adjusted to leave space for the smaller pentagon
-            center_edge_x = int(center_x + center_edge_radius * math.cos(base_angle) - 15)
-            center_edge_y = int(center_y + center_edge_radius * math.sin(base_angle) - 15)
-            center_edge_sticker = PentagonalSticker(edge, 3, container)
-            center_edge_sticker.move(center_edge_x, center_edge_y)
-            center_edge_sticker.clicked.connect(lambda checked, e=edge, s=3: 
-                                             self.on_sticker_clicked(self.face_id, e, s))
-            self.stickers.append(center_edge_sticker)
-    
+            for sticker_id, radius in enumerate(radii):
+                if sticker_id in (0, 3):
+                    cos_a, sin_a = _PENT_COS[edge], _PENT_SIN[edge]
+                else:
+                    cos_a, sin_a = _PENT_MID_COS[edge], _PENT_MID_SIN[edge]
+                x = int(center_x + radius * cos_a - 15)
+                y = int(center_y + radius * sin_a - 15)
+                positions.append((edge, sticker_id, x, y))
+        cls._POSITIONS = tuple(positions)
+        return cls._POSITIONS
+
+    @classmethod
+    def _hitmap(cls):
+        """
+        Build (once) the pixel-to-sticker-index lookup table.
+
+        Each pixel of the 400x400 face stores the index of the sticker
+        covering it, or 255 for none, so click dispatch is a single
+        array read instead of a scan over 20 bounding boxes.
+        """
+        if cls._HITMAP is None:
+            size = cls._STICKER_SIZE
+            hitmap = np.full((400, 400), 255, dtype=np.uint8)
+            for i, (edge, sticker_id, x, y) in enumerate(cls._compute_positions()):
+                hitmap[y:y + size, x:x + size] = i
+            cls._HITMAP = hitmap
+        return cls._HITMAP
+
+    @classmethod
+    def _pentagon_path(cls):
+        """Build (once) the path for the small black center pentagon."""
+        if cls._PENTAGON_PATH is None:
+            path = QPainterPath()
+            radius = 20
+            for i in range(5):
+                x = 200 + radius * _PENT_COS[i]
+                y = 200 + radius * _PENT_SIN[i]
+                if i == 0:
+                    path.moveTo(x, y)
+                else:
+                    path.lineTo(x, y)
+            path.closeSubpath()
+            cls._PENTAGON_PATH = path
+        return cls._PENTAGON_PATH
+
+    def paintEvent(self, event):
+        """Draw the 20 stickers and the center mechanism in one pass."""
+        painter = QPainter(self)
+        size = self._STICKER_SIZE
+
+        painter.setPen(_GRID_PEN)
+        for i, (edge, sticker_id, x, y) in enumerate(self._compute_positions()):
+            r, g, b = self._colors[i]
+            painter.fillRect(x, y, size, size, QColor(int(r), int(g), int(b)))
+            painter.drawRect(x, y, size, size)
+
+        # Small black pentagon mechanism (visual only, not interactive)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(_BLACK_BRUSH)
+        painter.setPen(_NO_PEN)
+        painter.drawPath(self._pentagon_path())
+
+    def mousePressEvent(self, event):
+        """Dispatch the click through the pixel hitmap."""
+        px, py = event.x(), event.y()
+        if 0 <= px < 400 and 0 <= py < 400:
+            index = int(self._hitmap()[py, px])
+            if index != 255:
+                edge, sticker_id = divmod(index, 4)
+                self.on_sticker_clicked(self.face_id, edge, sticker_id)
+                return
+        super().mousePressEvent(event)
+
     def get_color_state(self):
         """Return the color state of all stickers."""
-        return [sticker.getColor().getRgb()[:3] for sticker in self.stickers]
-    
+        return self._colors.tolist()
+
     def set_sticker_color(self, edge_id, sticker_id, color):
-        """Set the color of a specific sticker."""
-        sticker_index = edge_id * 4 + sticker_id
-        if 0 <= sticker_index < len(self.stickers):
-            self.stickers[sticker_index].setColor(color)
+        """Set the color of a specific sticker by edge coordinates."""
+        self.set_flat((edge_id << 2) | sticker_id, color)
+
+    def set_flat(self, index, color):
+        """
+        Set a sticker color by flat index (edge_id * 4 + sticker_id).
+
+        Args:
+            index (int): Flat sticker index (0-19).
+            color (QColor): New sticker color.
+        """
+        if 0 <= index < len(self._colors):
+            rgb = color.getRgb()[:3]
+            # Clicking a sticker with its current color is a no-op;
+            # skip the repaint entirely
+            if tuple(self._colors[index]) == rgb:
+                return
+            self._colors[index] = rgb
+            self.update()
+
+    def batch_set_colors(self, colors):
+        """
+        Set all 20 sticker colors with a single repaint.
+
+        Args:
+            colors: Iterable of 20 QColors in sticker order.
+        """
+        for i, color in enumerate(colors):
+            self._colors[i] = color.getRgb()[:3]
+        self.update()
 
 class MasterKilominxColorPicker(QWidget):
     """Color picker widget for Master Kilominx with 20 stickers per face."""
-    
+
     state_ready = pyqtSignal(dict)
-    
+    # Raw-array variant of state_ready: emits the (12, 20, 3) uint8
+    # color buffer so array-aware consumers skip the nested-list
+    # conversion entirely
+    state_ready_array = pyqtSignal(object)
+
     # Define standard colors for the Master Kilominx
     COLORS = {
         "White": QColor(255, 255, 255),
@@ -177,21 +243,51 @@ class MasterKilominxColorPicker(QWidget):
         "Dark Green": QColor(0, 100, 0),
         "Gray": QColor(128, 128, 128)
     }
-    
+
+    # Indexed views of the palette: ordered QColor tuple plus an RGB
+    # array, so nearest-palette-color queries vectorize instead of
+    # looping over the dict
+    _PALETTE_LIST = tuple(COLORS.values())
+    _PALETTE_RGB_NP = np.array(
+        [[c.red(), c.green(), c.blue()] for c in _PALETTE_LIST],
+        dtype=np.uint8
+    )
+
+    @classmethod
+    def classify_rgb(cls, samples):
+        """
+        Map RGB samples to their nearest palette color indices.
+
+        Args:
+            samples (ndarray): uint8[n, 3] RGB values (e.g. sensor or
+                image samples).
+
+        Returns:
+            ndarray: int index into _PALETTE_LIST for each sample.
+        """
+        samples = np.asarray(samples, dtype=np.int32)
+        palette = cls._PALETTE_RGB_NP.astype(np.int32)
+        diff = samples[:, None, :] - palette[None, :, :]
+        return np.argmin((diff * diff).sum(axis=-1), axis=1)
+
     def __init__(self, on_state_ready_callback):
         super().__init__()
-        
+
         self.on_state_ready_callback = on_state_ready_callback
         self.current_color = QColor(255, 255, 255)  # Start with white
         self.current_face = 0  # Start with face 0
-        self.face_widgets = []
-        
+
+        # Single contiguous backing store for all sticker colors; face
+        # widgets paint views of it, so never-built faces still have
+        # state and collecting the full state reads no widgets at all
+        self._colors = np.full((12, 20, 3), 200, dtype=np.uint8)
+
         self._setup_ui()
-        
+
     def _setup_ui(self):
         """Set up the UI components."""
         main_layout = QVBoxLayout(self)
-        
+
         # Instructions
         instructions = QLabel(
             "Select a color from the palette, then click on the stickers to color them. "
@@ -200,109 +296,141 @@ class MasterKilominxColorPicker(QWidget):
         )
         instructions.setWordWrap(True)
         main_layout.addWidget(instructions)
-        
+
         # Color palette
         color_group = QGroupBox("Color Palette")
         color_layout = QGridLayout()
-        
+
         row, col = 0, 0
         for color_name, color in self.COLORS.items():
             btn = QPushButton(color_name)
-            palette = btn.palette()
-            palette.setColor(QPalette.Button, color)
-            btn.setPalette(palette)
-            btn.setAutoFillBackground(True)
-            btn.clicked.connect(lambda checked, c=color: self._select_color(c))
-            
+            # Cached stylesheet instead of a palette clone per button
+            btn.setStyleSheet(_button_qss(color.rgb() & 0xFFFFFF))
+            # partial is a C-level callable; a lambda here would keep a
+            # Python closure frame alive per palette button
+            btn.clicked.connect(functools.partial(self._select_color, color))
+
             color_layout.addWidget(btn, row, col)
             col += 1
             if col > 3:  # 4 colors per row
                 col = 0
                 row += 1
-                
+
         color_group.setLayout(color_layout)
         main_layout.addWidget(color_group)
-        
+
         # Current color indicator
         color_indicator_layout = QHBoxLayout()
         color_indicator_layout.addWidget(QLabel("Current Color:"))
-        
+
         self.color_indicator = QPushButton()
         self.color_indicator.setFixedSize(40, 40)
         self.color_indicator.setEnabled(False)
-        palette = self.color_indicator.palette()
-        palette.setColor(QPalette.Button, self.current_color)
-        self.color_indicator.setPalette(palette)
-        self.color_indicator.setAutoFillBackground(True)
-        
+        self.color_indicator.setStyleSheet(
+            _button_qss(self.current_color.rgb() & 0xFFFFFF))
+
         color_indicator_layout.addWidget(self.color_indicator)
         color_indicator_layout.addStretch()
-        
+
         main_layout.addLayout(color_indicator_layout)
-        
-        # Face selector
+
+        # Face selector: a row of checkable tool buttons in an exclusive
+        # group; switching is one C++-side toggle plus a single slot
+        # call, with no combo box popup
         face_selector_layout = QHBoxLayout()
-        face_selector_layout.addWidget(QLabel("Current Face:"))
-        
-        self.face_selector = QComboBox()
+        face_selector_layout.addWidget(QLabel("Face:"))
+
+        self.face_group = QButtonGroup(self)
+        self.face_group.setExclusive(True)
         for i in range(12):
-            self.face_selector.addItem(f"Face {i+1}")
-        self.face_selector.currentIndexChanged.connect(self._change_face)
-        
-        face_selector_layout.addWidget(self.face_selector)
+            btn = QToolButton()
+            btn.setText(str(i + 1))
+            btn.setCheckable(True)
+            btn.setChecked(i == 0)
+            self.face_group.addButton(btn, i)
+            face_selector_layout.addWidget(btn)
+        self.face_group.buttonClicked[int].connect(self._change_face)
+
         face_selector_layout.addStretch()
-        
+
         main_layout.addLayout(face_selector_layout)
-        
-        # Pentagon face widget container
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        
-        face_container = QWidget()
-        self.face_layout = QVBoxLayout(face_container)
-        
-        # Create pentagonal face widgets
-        for face in range(12):
-            face_widget = PentagonalFaceWidget(face, self._on_sticker_clicked)
-            face_widget.setVisible(face == 0)  # Show only the first face initially
-            self.face_widgets.append(face_widget)
-            self.face_layout.addWidget(face_widget)
-        
-        scroll_area.setWidget(face_container)
-        main_layout.addWidget(scroll_area, 1)
-        
+
+        # One face widget serves all 12 faces; switching just retargets
+        # it at another slice of the colors array (no widget
+        # construction, no stack, no layout work). The widget is fixed
+        # at 400x400, so no scroll area is needed around it.
+        self.face_view = PentagonalFaceWidget(0, self._on_sticker_clicked,
+                                              self._colors[0])
+        main_layout.addWidget(self.face_view, 1, Qt.AlignCenter)
+
         # Solve button
         solve_button = QPushButton("Validate & Solve")
         solve_button.clicked.connect(self._on_solve_clicked)
         main_layout.addWidget(solve_button)
-        
+
+    @pyqtSlot(QColor)
     def _select_color(self, color):
         """Handle color selection from the palette."""
+        if color.rgb() == self.current_color.rgb():
+            return
         self.current_color = color
-        palette = self.color_indicator.palette()
-        palette.setColor(QPalette.Button, color)
-        self.color_indicator.setPalette(palette)
-        
+        self.color_indicator.setStyleSheet(_button_qss(color.rgb() & 0xFFFFFF))
+
+    @pyqtSlot(int)
     def _change_face(self, index):
         """Switch between faces of the Master Kilominx."""
         self.current_face = index
-        
-        # Update visibility of face widgets
-        for i, face_widget in enumerate(self.face_widgets):
-            face_widget.setVisible(i == index)
-            
+        self.face_view.show_face(index, self._colors[index])
+
     def _on_sticker_clicked(self, face_id, edge_id, sticker_id):
         """Handle sticker click to apply current color."""
         if face_id == self.current_face:
-            self.face_widgets[face_id].set_sticker_color(edge_id, sticker_id, self.current_color)
-        
+            self.face_view.set_sticker_color(edge_id, sticker_id, self.current_color)
+
+    def apply_cube_state(self, state):
+        """
+        Load a full cube state (e.g. from image processing) at once.
+
+        All 240 sticker colors land in the backing array in one pass
+        with a single repaint of the visible face.
+
+        Faces with fewer than 20 stickers (the image pipeline produces
+        16 per face) fill the leading slots and leave the remainder at
+        the placeholder gray; extra stickers are truncated.
+
+        Args:
+            state (dict): Mapping of "face_<i>" to lists of RGB triples.
+        """
+        for face_key, colors in state.items():
+            face_idx = int(face_key.split("_")[1])
+            face = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+            count = min(len(face), 20)
+            self._colors[face_idx, :count] = face[:count]
+            self._colors[face_idx, count:] = 200
+        self.face_view.update()
+
+    def get_cube_state(self):
+        """Return the cube state as a dict of "face_<i>" color lists.
+
+        Read straight from the backing array; faces the user never
+        viewed report the default colors without any widget being built.
+
+        Returns:
+            dict: Mapping of "face_<i>" to 20 RGB triples.
+        """
+        return {
+            f"face_{face_idx}": self._colors[face_idx].tolist()
+            for face_idx in range(12)
+        }
+
+    @pyqtSlot()
     def _on_solve_clicked(self):
         """Prepare the cube state and emit the state_ready signal."""
-        # Collect the colors from all faces
-        cube_state = {}
-        
-        for face_idx, face_widget in enumerate(self.face_widgets):
-            cube_state[f"face_{face_idx}"] = face_widget.get_color_state()
-            
+        cube_state = self.get_cube_state()
+
+        # Array-aware consumers get the buffer itself (copied so later
+        # edits don't mutate what they received)
+        self.state_ready_array.emit(self._colors.copy())
+
         # Call the callback with the collected state
-        self.on_state_ready_callback(cube_state)
\ No newline at end of file
+        self.on_state_ready_callback(cube_state)
@@ -3,43 +3,64 @@ Widget for processing images of a Master Kilominx to extract colors.
 """
 
 import os
-import cv2
-import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                            QLabel, QFileDialog, QMessageBox, QProgressBar)
-from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
+from PyQt5.QtGui import QPixmap, QImage, QImageReader
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, pyqtSignal,
+                          pyqtSlot)
 
-from utils.image_processor import extract_colors_from_image
+class _ProcessorSignals(QObject):
+    """Signal holder for ImageProcessorRunnable (QRunnable is not a QObject)."""
 
-class ImageProcessorThread(QThread):
-    """Thread for processing images without blocking the UI."""
-    
     processing_complete = pyqtSignal(dict)
     processing_error = pyqtSignal(str)
     processing_progress = pyqtSignal(int)
-    
+
+class ImageProcessorRunnable(QRunnable):
+    """Pooled task for processing images without blocking the UI.
+
+    Runs on the global QThreadPool, which reuses worker threads instead
+    of paying QThread start/stop cost per image, and cannot be orphaned
+    mid-run the way a re-created QThread could be.
+    """
+
     def __init__(self, image_path):
         super().__init__()
         self.image_path = image_path
-        
+        self.signals = _ProcessorSignals()
+        self._last_pct = -1
+
     def run(self):
         """Run the image processing."""
         try:
+            # Imported here so OpenCV (pulled in by the processor) loads
+            # on the worker thread the first time an image is processed,
+            # not at window startup
+            from utils.image_processor import extract_colors_from_image
+
             # Extract colors from the image
             # This is a mock function call - the actual implementation would be more complex
             cube_state = extract_colors_from_image(
                 self.image_path, progress_callback=self._progress_callback
             )
-            
-            self.processing_complete.emit(cube_state)
-            
+
+            self.signals.processing_complete.emit(cube_state)
+
         except Exception as e:
-            self.processing_error.emit(str(e))
-            
+            self.signals.processing_error.emit(str(e))
+
     def _progress_callback(self, progress):
-        """Report progress back to the UI."""
-        self.processing_progress.emit(progress)
+        """Report progress back to the UI, throttled to 1% granularity.
+
+        The processor may report progress per-tile; emitting a
+        cross-thread signal for each report would flood the UI event
+        loop, so only whole-percent changes are forwarded (at most
+        ~100 emissions per image).
+        """
+        pct = int(progress)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.signals.processing_progress.emit(pct)
 
 class ImageInputWidget(QWidget):
     """Widget for handling image input for the Master Kilominx solver."""
@@ -123,16 +144,23 @@ class ImageInputWidget(QWidget):
     def _display_image(self, image_path):
         """Display the image in the preview area."""
         try:
-            # Load and resize the image to fit the preview area
-            pixmap = QPixmap(image_path)
-            pixmap = pixmap.scaled(
-                self.image_preview.width(), self.image_preview.height(),
-                Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            self.image_preview.setPixmap(pixmap)
-            
+            # Decode directly at preview size: setScaledSize makes the
+            # reader downscale during decode, so a full-resolution photo
+            # is never materialized just to be thrown away
+            reader = QImageReader(image_path)
+            reader.setAutoTransform(True)
+            size = reader.size()
+            if size.isValid():
+                size.scale(self.image_preview.width(),
+                           self.image_preview.height(), Qt.KeepAspectRatio)
+                reader.setScaledSize(size)
+            image = reader.read()
+            if image.isNull():
+                raise ValueError(reader.errorString())
+            self.image_preview.setPixmap(QPixmap.fromImage(image))
+
         except Exception as e:
-            QMessageBox.warning(self, "Image Loading Error", 
+            QMessageBox.warning(self, "Image Loading Error",
                               f"Failed to load image: {str(e)}")
             
     def _process_image(self):
@@ -141,18 +169,20 @@ class ImageInputWidget(QWidget):
             QMessageBox.warning(self, "No Image", "Please upload an image first.")
             return
             
-        # Disable UI elements during processing
+        # The button is disabled for the whole run, so a double-click
+        # can never start two overlapping jobs
         self.process_button.setEnabled(False)
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
         self.status_label.setText("Processing image...")
-        
-        # Start processing thread
-        self.processor_thread = ImageProcessorThread(self.image_path)
-        self.processor_thread.processing_complete.connect(self._on_processing_complete)
-        self.processor_thread.processing_error.connect(self._on_processing_error)
-        self.processor_thread.processing_progress.connect(self._update_progress)
-        self.processor_thread.start()
+
+        # Hand the job to the shared thread pool; keep a reference so
+        # the signal holder outlives this method
+        self.processor_task = ImageProcessorRunnable(self.image_path)
+        self.processor_task.signals.processing_complete.connect(self._on_processing_complete)
+        self.processor_task.signals.processing_error.connect(self._on_processing_error)
+        self.processor_task.signals.processing_progress.connect(self._update_progress)
+        QThreadPool.globalInstance().start(self.processor_task)
         
     @pyqtSlot(dict)
     def _on_processing_complete(self, cube_state):
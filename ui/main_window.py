@@ -14,7 +14,6 @@ from ui.image_input import ImageInputWidget
 from ui.solution_display import SolutionDisplayWidget
 from solver.state_validator import validate_kilominx_state
 from solver.solver_algorithm import solve_kilominx
-from utils.image_processor import extract_colors_from_image
 
 class MainWindow(QMainWindow):
     """Main window of the application containing all UI elements."""
@@ -133,6 +132,9 @@ class MainWindow(QMainWindow):
     def _on_image_processed(self, state):
         """Callback when image processing is complete."""
         self.cube_state = state
+        # Mirror the extracted colors into the manual picker so the
+        # user can review and touch them up
+        self.manual_input_tab.apply_cube_state(state)
         self._validate_and_solve()
         
     def _validate_and_solve(self):
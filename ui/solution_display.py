@@ -2,49 +2,98 @@
 Widget for displaying the step-by-step solution for the Master Kilominx.
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+import numpy as np
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                            QListWidget, QListWidgetItem, QPushButton,
                            QGroupBox, QGridLayout, QScrollArea, QSplitter)
-from PyQt5.QtGui import QColor, QPalette, QBrush, QPixmap
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QImage, QPainter, QBrush, QPixmap
+from PyQt5.QtCore import Qt, QSize, pyqtSignal
+
+def _state_to_array(state):
+    """Convert a dict-of-lists cube state to a (12, 16, 3) uint8 array.
+
+    The array is the display's canonical representation: copying a
+    state is one memcpy instead of a dict rebuild, and each face row
+    feeds the paint path without further conversion. Faces with extra
+    stickers (e.g. 20-sticker picker states) are truncated to the 16
+    the visualization shows; missing faces stay default gray.
+    """
+    arr = np.full((12, 16, 3), 200, dtype=np.uint8)
+    for i in range(12):
+        face = np.asarray(state.get(f"face_{i}", ()), dtype=np.uint8)
+        count = min(len(face), 16)
+        if count:
+            arr[i, :count] = face[:count]
+    return arr
 
 class KilominxFaceWidget(QWidget):
-    """Widget for displaying a single face of the Kilominx in the solution display."""
-    
+    """Widget for displaying a single face of the Kilominx in the solution display.
+
+    The 4x4 sticker grid is painted directly in paintEvent instead of
+    being built from 16 child QLabels, so each face costs one widget
+    rather than seventeen in layout, style and event dispatch.
+    """
+
+    _CELL_STEP = 22  # pixels per sticker cell
+
     def __init__(self, face_data, parent=None):
         super().__init__(parent)
         self.face_data = face_data
-        self._setup_ui()
-        
-    def _setup_ui(self):
-        """Set up the UI for this face."""
-        layout = QGridLayout(self)
-        layout.setSpacing(2)
-        
-        # Create a 4x4 grid of colored squares
-        for row in range(4):
-            for col in range(4):
-                color_idx = row * 4 + col
-                if color_idx < len(self.face_data):
-                    color_data = self.face_data[color_idx]
-                    color = QColor(*color_data)
-                else:
-                    color = QColor(200, 200, 200)  # Default gray
-                    
-                square = QLabel()
-                square.setFixedSize(20, 20)
-                palette = square.palette()
-                palette.setColor(QPalette.Window, color)
-                square.setPalette(palette)
-                square.setAutoFillBackground(True)
-                
-                layout.addWidget(square, row, col)
-                
-        self.setLayout(layout)
+        self._cached_pixmap = None
+        self.setFixedSize(4 * self._CELL_STEP, 4 * self._CELL_STEP)
+
+    def update_colors(self, face_data):
+        """Adopt new face data and schedule a repaint.
+
+        update() (rather than repaint()) lets Qt coalesce paint events
+        when several faces change in the same event-loop turn.
+        """
+        self.face_data = face_data
+        self._cached_pixmap = None
+        self.update()
+
+    def _render_pixmap(self):
+        """Render the face into a pixmap sized to the widget.
+
+        The 4x4 colors are packed into a tiny uint8 array, wrapped in a
+        QImage, and scaled once by Qt's C++ blit (FastTransformation
+        keeps the sticker blocks crisp); grid lines are drawn on top.
+        The result is cached until the face data changes, so repeated
+        repaints of the same step cost a single pixmap blit.
+        """
+        arr = np.full((16, 3), 200, dtype=np.uint8)  # Default gray
+        count = min(len(self.face_data), 16)
+        if count:
+            arr[:count] = np.asarray(self.face_data, dtype=np.uint8)[:count]
+        arr = np.ascontiguousarray(arr.reshape(4, 4, 3))
+
+        image = QImage(arr.data, 4, 4, 4 * 3, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(
+            image.scaled(self.width(), self.height(), Qt.IgnoreAspectRatio,
+                         Qt.FastTransformation))
+
+        # Grid lines between the sticker blocks
+        painter = QPainter(pixmap)
+        for i in range(1, 4):
+            offset = i * self._CELL_STEP - 1
+            painter.fillRect(offset, 0, 2, pixmap.height(), Qt.black)
+            painter.fillRect(0, offset, pixmap.width(), 2, Qt.black)
+        painter.end()
+
+        return pixmap
+
+    def paintEvent(self, event):
+        """Blit the cached face pixmap."""
+        if self._cached_pixmap is None:
+            self._cached_pixmap = self._render_pixmap()
+        QPainter(self).drawPixmap(0, 0, self._cached_pixmap)
 
 class SolutionDisplayWidget(QWidget):
     """Widget for displaying the solution to the Master Kilominx."""
-    
+
+    # Emitted once per actual step change, after the view has updated
+    stepChanged = pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
         self.solution_steps = []
@@ -105,8 +154,25 @@ class SolutionDisplayWidget(QWidget):
         # Create a widget to hold the faces
         vis_content = QWidget()
         self.vis_layout = QGridLayout(vis_content)
-        
-        # We'll populate this when a solution is loaded
+
+        # Create the 12 face widgets once, laid out as a simplified
+        # unfolded dodecahedron; step changes only recolor them
+        self.face_widgets = [KilominxFaceWidget([]) for _ in range(12)]
+
+        # Row 0: Face 0
+        self.vis_layout.addWidget(self.face_widgets[0], 0, 1)
+
+        # Row 1: Faces 1-5
+        for i in range(5):
+            self.vis_layout.addWidget(self.face_widgets[i + 1], 1, i)
+
+        # Row 2: Faces 6-10
+        for i in range(5):
+            self.vis_layout.addWidget(self.face_widgets[i + 6], 2, i)
+
+        # Row 3: Face 11
+        self.vis_layout.addWidget(self.face_widgets[11], 3, 1)
+
         self.visualization.setWidget(vis_content)
         right_layout.addWidget(self.visualization)
         
@@ -123,23 +189,29 @@ class SolutionDisplayWidget(QWidget):
         """Display the solution for the given cube state."""
         self.initial_state = initial_state
         self.solution_steps = solution_steps
-        self.current_states = [initial_state]  # Start with initial state
-
-# Generate intermediate states by applying steps
-        current_state = initial_state.copy()
-        for step in solution_steps:
-            # This would call a function to apply the move to the current state
-            # and generate a new state, which we store for visualization
-            new_state = self._apply_move_to_state(current_state, step)
-            self.current_states.append(new_state)
-            current_state = new_state
-            
-        # Populate the steps list
-        self.steps_list.clear()
-        self.steps_list.addItem("Initial State")
-        for i, step in enumerate(solution_steps):
-            self.steps_list.addItem(f"Step {i+1}: {step}")
-            
+
+        # Intermediate states are derived lazily as the user navigates
+        # and memoized by step index — a 200-move solution whose first
+        # two steps are viewed never materializes the other 198 states.
+        # The dict state is flattened to the canonical array form once.
+        self.current_states = {0: _state_to_array(initial_state)}
+
+
+        # Populate the steps list in one batch: addItems does a single
+        # layout pass, and blocked signals keep clear()/population from
+        # firing spurious currentRowChanged renders
+        items = ["Initial State"] + [f"Step {i+1}: {step}"
+                                     for i, step in enumerate(solution_steps)]
+        self.steps_list.setUpdatesEnabled(False)
+        self.steps_list.blockSignals(True)
+        try:
+            self.steps_list.clear()
+            self.steps_list.addItems(items)
+        finally:
+            self.steps_list.blockSignals(False)
+            self.steps_list.setUpdatesEnabled(True)
+
+
         # Show initial state
         self.current_step = 0
         self._show_step(0)
@@ -149,32 +221,52 @@ class SolutionDisplayWidget(QWidget):
         self.prev_button.setEnabled(False)
         
     def _on_step_selected(self, row):
-        """Handle selection of a step in the list."""
+        """Handle selection of a step in the list.
+
+        This is the single rendering slot: the navigation buttons only
+        move the list row, so list clicks, button clicks and key
+        repeats all funnel through here and each step change renders
+        exactly once.
+        """
         if row >= 0 and row <= len(self.solution_steps):
             self.current_step = row
             self._show_step(row)
-            
+
             # Update button states
             self.prev_button.setEnabled(row > 0)
             self.next_button.setEnabled(row < len(self.solution_steps))
-            
+
+            self.stepChanged.emit(row)
+
     def _prev_step(self):
         """Go to the previous step."""
         if self.current_step > 0:
-            self.current_step -= 1
-            self.steps_list.setCurrentRow(self.current_step)
-            self._show_step(self.current_step)
-            
+            self.steps_list.setCurrentRow(self.current_step - 1)
+
     def _next_step(self):
         """Go to the next step."""
         if self.current_step < len(self.solution_steps):
-            self.current_step += 1
-            self.steps_list.setCurrentRow(self.current_step)
-            self._show_step(self.current_step)
+            self.steps_list.setCurrentRow(self.current_step + 1)
             
+    def _state_at(self, step_index):
+        """Return the cube state after step_index moves, memoized.
+
+        Walks forward from the highest cached index, applying each
+        move exactly once and caching every intermediate along the way.
+        """
+        if step_index not in self.current_states:
+            start = max(i for i in self.current_states if i < step_index)
+            state = self.current_states[start]
+            for i in range(start, step_index):
+                state = self._apply_move_to_state(state, self.solution_steps[i])
+                self.current_states[i + 1] = state
+
+        return self.current_states[step_index]
+
     def _show_step(self, step_index):
         """Display the cube state at the given step."""
-        if not self.current_states or step_index < 0 or step_index >= len(self.current_states):
+        if (not self.current_states or step_index < 0
+                or step_index > len(self.solution_steps)):
             return
             
         # Update step description
@@ -183,40 +275,28 @@ class SolutionDisplayWidget(QWidget):
         else:
             self.step_description.setText(f"Step {step_index}: {self.solution_steps[step_index-1]}")
             
-        # Clear existing visualization
-        while self.vis_layout.count():
-            item = self.vis_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
-        # Create the face grid for the current state
-        state = self.current_states[step_index]
-        
-        # Create a layout that resembles the unfolded dodecahedron
-        # This is a simplified representation
-        
-        # Row 0: Face 0
-        self.vis_layout.addWidget(KilominxFaceWidget(state.get("face_0", [])), 0, 1)
-        
-        # Row 1: Faces 1-5
-        for i in range(5):
-            self.vis_layout.addWidget(KilominxFaceWidget(state.get(f"face_{i+1}", [])), 1, i)
-            
-        # Row 2: Faces 6-10
-        for i in range(5):
-            self.vis_layout.addWidget(KilominxFaceWidget(state.get(f"face_{i+6}", [])), 2, i)
-            
-        # Row 3: Face 11
-        self.vis_layout.addWidget(KilominxFaceWidget(state.get("face_11", [])), 3, 1)
+        # Recolor the pre-built face widgets in place — no widget
+        # teardown or reconstruction per step. Updates are suspended
+        # around the batch so the description relayout and the 12 face
+        # repaints merge into one paint pass per navigation click.
+        state = self._state_at(step_index)
+        self.setUpdatesEnabled(False)
+        try:
+            for i, face_widget in enumerate(self.face_widgets):
+                face_widget.update_colors(state[i])
+        finally:
+            self.setUpdatesEnabled(True)
         
     def _apply_move_to_state(self, current_state, move):
         """
-        Apply a move to the current state and return the new state.
-        This would call into the solver's move application logic.
+        Apply a move to the current (12, 16, 3) state array and return
+        the new state. This would call into the solver's move
+        application logic.
         """
         # In a real implementation, this would use the solver module
         # For this demo, we just return a copy of the current state
-        # as a placeholder (the actual implementation would transform the state)
+        # (a single memcpy on the array representation) as a
+        # placeholder — the actual implementation would permute rows
         new_state = current_state.copy()
         
         # Here we would transform the state according to the move
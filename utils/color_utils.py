@@ -5,6 +5,38 @@ Utilities for handling colors in the Master Kilominx solver.
 import math
 import numpy as np
 
+# Standard colors with names, shared by the name lookup below
+STANDARD_COLORS = {
+    "Red": [255, 0, 0],
+    "Green": [0, 255, 0],
+    "Blue": [0, 0, 255],
+    "Yellow": [255, 255, 0],
+    "Cyan": [0, 255, 255],
+    "Magenta": [255, 0, 255],
+    "White": [255, 255, 255],
+    "Black": [0, 0, 0],
+    "Gray": [128, 128, 128],
+    "Orange": [255, 165, 0],
+    "Purple": [128, 0, 128],
+    "Brown": [165, 42, 42]
+}
+
+_COLOR_NAMES = tuple(STANDARD_COLORS.keys())
+_COLOR_ANCHORS = np.array(list(STANDARD_COLORS.values()), dtype=np.int32)
+
+def _build_name_lut():
+    """Precompute the nearest standard color for every 8x8x8 RGB bin.
+
+    The palette is fixed, so the nearest-anchor search can be done once
+    at import for all 32**3 bins; get_color_name then reduces to a
+    single table index instead of twelve distance computations.
+    """
+    grid = np.indices((32, 32, 32)).reshape(3, -1).T * 8 + 4  # bin centers
+    dists = ((grid[:, None, :] - _COLOR_ANCHORS[None, :, :]) ** 2).sum(-1)
+    return dists.argmin(axis=1).astype(np.uint8).reshape(32, 32, 32)
+
+_NAME_LUT = _build_name_lut()
+
 def rgb_to_hex(rgb):
     """
     Convert an RGB color to hex format.
@@ -41,29 +73,42 @@ def color_distance(color1, color2):
     Returns:
         float: Distance between the colors.
     """
-    return math.sqrt(sum((c1 - c2) ** 2 for c1, c2 in zip(color1, color2)))
+    diff = np.subtract(color1, color2, dtype=np.float64)
+    return math.sqrt((diff * diff).sum())
+
+def nearest_color_batch(colors, anchors):
+    """
+    Find the nearest anchor color for each color in a batch.
+
+    Works on squared distances — the square root is monotonic, so it
+    is never needed for an argmin.
+
+    Args:
+        colors: (N, 3) array-like of RGB colors to classify.
+        anchors: (K, 3) array-like of reference RGB colors.
+
+    Returns:
+        numpy.ndarray: (N,) array of anchor indices.
+    """
+    colors = np.asarray(colors, dtype=np.int32)
+    anchors = np.asarray(anchors, dtype=np.int32)
+    dists = ((colors[:, None, :] - anchors[None, :, :]) ** 2).sum(-1)
+    return dists.argmin(axis=1)
 
 def find_nearest_standard_color(color, standard_colors):
     """
     Find the nearest standard color to a given color.
-    
+
     Args:
         color: RGB color to match.
         standard_colors (dict): Dictionary mapping color names to RGB values.
-        
+
     Returns:
         tuple: (color_name, rgb_value) of the nearest standard color.
     """
-    min_distance = float('inf')
-    nearest_color = None
-    
-    for name, rgb in standard_colors.items():
-        dist = color_distance(color, rgb)
-        if dist < min_distance:
-            min_distance = dist
-            nearest_color = (name, rgb)
-            
-    return nearest_color
+    names = list(standard_colors)
+    idx = int(nearest_color_batch([color], list(standard_colors.values()))[0])
+    return names[idx], standard_colors[names[idx]]
 
 def cluster_colors(colors, num_clusters=12):
     """
@@ -81,8 +126,11 @@ def cluster_colors(colors, num_clusters=12):
     # Convert to numpy array
     colors_array = np.array(colors)
     
-    # Apply K-means clustering
-    kmeans = KMeans(n_clusters=num_clusters)
+    # Apply K-means clustering. Sticker batches are tiny and well
+    # separated, so one init with a short iteration cap converges to
+    # the same centers as the default ten inits at a tenth of the cost.
+    kmeans = KMeans(n_clusters=num_clusters, n_init=1, max_iter=20,
+                    random_state=0)
     kmeans.fit(colors_array)
     
     # Get cluster centers
@@ -103,25 +151,9 @@ def get_color_name(rgb):
     Returns:
         str: Approximate color name.
     """
-    # Define standard colors with names
-    standard_colors = {
-        "Red": [255, 0, 0],
-        "Green": [0, 255, 0],
-        "Blue": [0, 0, 255],
-        "Yellow": [255, 255, 0],
-        "Cyan": [0, 255, 255],
-        "Magenta": [255, 0, 255],
-        "White": [255, 255, 255],
-        "Black": [0, 0, 0],
-        "Gray": [128, 128, 128],
-        "Orange": [255, 165, 0],
-        "Purple": [128, 0, 128],
-        "Brown": [165, 42, 42]
-    }
-    
-    # Find the nearest standard color
-    name, _ = find_nearest_standard_color(rgb, standard_colors)
-    return name
+    # One lookup in the precomputed 32x32x32 bin table
+    idx = _NAME_LUT[rgb[0] >> 3, rgb[1] >> 3, rgb[2] >> 3]
+    return _COLOR_NAMES[idx]
 
 def normalize_colors(colors):
     """
@@ -133,21 +165,14 @@ def normalize_colors(colors):
     Returns:
         list: Normalized colors.
     """
-    # Convert to numpy array
-    colors_array = np.array(colors)
-    
-    # Calculate mean and standard deviation
-    mean = np.mean(colors_array, axis=0)
-    std = np.std(colors_array, axis=0)
-    
-    # Normalize (z-score normalization)
-    normalized = (colors_array - mean) / (std + 1e-8)  # Add small epsilon to avoid division by zero
-    
-    # Scale back to 0-255 range
-    normalized = (normalized * 64) + 128
-    
-    # Clip to valid range and convert to integers
-    normalized = np.clip(normalized, 0, 255)
-    normalized = normalized.astype(int)
-    
-    return normalized.tolist()
\ No newline at end of file
+    # float32 is plenty of precision for 8-bit channels and halves the
+    # memory traffic of the default float64 intermediates
+    colors_array = np.asarray(colors, dtype=np.float32)
+
+    # Z-score normalize, rescale to 0-255 and saturate back to uint8
+    # in one fused expression (epsilon avoids division by zero)
+    mean = colors_array.mean(axis=0)
+    std = colors_array.std(axis=0) + 1e-8
+    normalized = np.clip((colors_array - mean) / std * 64 + 128, 0, 255)
+
+    return normalized.astype(np.uint8).tolist()
\ No newline at end of file
@@ -53,7 +53,11 @@ DEFAULT_CONFIG = {
 
 class Config:
     """Configuration manager for the application."""
-    
+
+    # Directory creation is idempotent across instances; the syscalls
+    # only need to happen once per process
+    _paths_initialized = False
+
     def __init__(self, config_file=None):
         """
         Initialize the configuration.
@@ -66,19 +70,25 @@ class Config:
         # Load configuration file if provided
         if config_file and os.path.exists(config_file):
             self.load_config(config_file)
-            
+
+        # Flatten the color table so render-time lookups skip the
+        # nested section/key indirection
+        self._refresh_color_cache()
+
         # Initialize paths
         self._init_paths()
+
+    def _refresh_color_cache(self):
+        """Rebuild the flattened standard-color lookup table."""
+        self._standard_colors = self.config.get("colors", {}).get(
+            "standard_colors", {})
         
     def _init_paths(self):
         """Initialize application paths."""
         # Define paths relative to user's home directory
         home_dir = str(Path.home())
         app_dir = os.path.join(home_dir, ".kilominx_solver")
-        
-        # Create directories if they don't exist
-        os.makedirs(app_dir, exist_ok=True)
-        
+
         # Define paths for various application data
         self.paths = {
             "app_dir": app_dir,
@@ -86,11 +96,13 @@ class Config:
             "saved_states": os.path.join(app_dir, "saved_states"),
             "logs": os.path.join(app_dir, "logs")
         }
-        
-        # Create subdirectories
-        for path in self.paths.values():
-            if isinstance(path, str) and not os.path.isfile(path):
-                os.makedirs(path, exist_ok=True)
+
+        # Create the directories once per process; every later
+        # Config() construction skips the filesystem entirely
+        if not Config._paths_initialized:
+            for key in ("app_dir", "saved_states", "logs"):
+                Path(self.paths[key]).mkdir(parents=True, exist_ok=True)
+            Config._paths_initialized = True
                 
     def load_config(self, config_file):
         """
@@ -105,7 +117,8 @@ class Config:
                 
             # Update configuration
             self._update_dict(self.config, loaded_config)
-            
+            self._refresh_color_cache()
+
         except Exception as e:
             print(f"Error loading configuration: {str(e)}")
             
@@ -172,8 +185,11 @@ class Config:
         """
         if section not in self.config:
             self.config[section] = {}
-            
+
         self.config[section][key] = value
+
+        if section == "colors":
+            self._refresh_color_cache()
         
     def get_color(self, color_name):
         """
@@ -185,8 +201,7 @@ class Config:
         Returns:
             list: RGB color values, or None if not found.
         """
-        colors = self.get("colors", "standard_colors", {})
-        return colors.get(color_name)
+        return self._standard_colors.get(color_name)
 
 # Global configuration instance
 config = Config()
\ No newline at end of file
@@ -2,10 +2,12 @@
 Image processing utilities for extracting colors from Kilominx images.
 """
 
-import cv2
 import numpy as np
-from sklearn.cluster import KMeans
-import math
+
+# cv2 and sklearn are deliberately NOT imported at module level: both
+# cost hundreds of ms and hit every app startup through the UI import
+# chain, even when no image is ever processed. They are imported inside
+# the functions that need them instead.
 
 def extract_colors_from_image(image_path, progress_callback=None):
     """
@@ -19,6 +21,8 @@ def extract_colors_from_image(image_path, progress_callback=None):
         dict: Dictionary mapping face indices to lists of colors.
     """
     try:
+        import cv2
+
         # Load image
         image = cv2.imread(image_path)
         if image is None:
@@ -67,33 +71,65 @@ def extract_colors_from_image(image_path, progress_callback=None):
 def detect_faces(image):
     """
     Detect the pentagon faces in the Kilominx image.
-    
-    This is a placeholder for a more sophisticated detection algorithm.
-    In a real implementation, this would use computer vision techniques
-    to find the pentagonal faces of the Kilominx.
-    
+
+    Candidate contours are found with OpenCV's edge and contour
+    routines, approximated to polygons and kept when they have five
+    vertices and a plausible area. When fewer than 12 pentagons are
+    found, the old fixed-grid layout is used as a fallback so the rest
+    of the pipeline still runs on photos the detector cannot handle.
+
     Args:
         image: RGB image of the Kilominx.
-        
+
     Returns:
-        list: List of face regions (each defined by a bounding box or contour).
+        list: List of face regions (each defined by a bounding box).
+    """
+    import cv2
+    from utils.config import config
+
+    min_face_size = config.get("image_processing", "min_face_size", 50)
+
+    # Edge map and external contours; all of this runs inside
+    # OpenCV's SIMD-optimized C code
+    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    edges = cv2.Canny(gray, 50, 150)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL,
+                                   cv2.CHAIN_APPROX_SIMPLE)
+
+    # Keep contours that approximate to a pentagon of reasonable size
+    face_regions = []
+    min_area = min_face_size ** 2
+    for contour in contours:
+        approx = cv2.approxPolyDP(contour, 0.04 * cv2.arcLength(contour, True),
+                                  True)
+        if len(approx) == 5 and cv2.contourArea(contour) >= min_area:
+            x, y, w, h = cv2.boundingRect(contour)
+            face_regions.append((x, y, x + w, y + h))
+
+    if len(face_regions) >= 12:
+        # Take the 12 largest candidates, then order them
+        # top-to-bottom, left-to-right for a stable face numbering
+        face_regions.sort(
+            key=lambda r: (r[2] - r[0]) * (r[3] - r[1]), reverse=True)
+        face_regions = face_regions[:12]
+        face_regions.sort(key=lambda r: (r[1], r[0]))
+        return face_regions
+
+    return _grid_face_regions(image)
+
+def _grid_face_regions(image):
+    """Return a fixed 3x4 grid of face regions covering the image.
+
+    Fallback used when pentagon detection finds fewer than 12 faces.
     """
-    # This is a simplified placeholder implementation
-    # In a real app, this would use contour detection, shape analysis, etc.
-    
-    # Get image dimensions
     height, width = image.shape[:2]
-    
-    # For this demo, we'll create 12 synthetic face regions
-    # In a real implementation, these would be detected from the image
-    
-    # Create a grid layout as a placeholder
+
     rows, cols = 3, 4
     face_width = width // cols
     face_height = height // rows
-    
+
     face_regions = []
-    
+
     for row in range(rows):
         for col in range(cols):
             # Define a rectangular region for this face
@@ -101,9 +137,9 @@ def detect_faces(image):
             y1 = row * face_height
             x2 = (col + 1) * face_width
             y2 = (row + 1) * face_height
-            
+
             face_regions.append((x1, y1, x2, y2))
-            
+
     return face_regions
     
 def extract_grid_colors(image, face_region):
@@ -121,32 +157,32 @@ def extract_grid_colors(image, face_region):
     
     # Extract the face sub-image
     face_image = image[y1:y2, x1:x2]
+
+    # A phone photo can put tens of thousands of pixels in each cell;
+    # dominant colors survive aggressive downsampling, so box-filter
+    # the face to 64x64 first (INTER_AREA averages pixels in SIMD C,
+    # exactly the reduction the cells need) and average 16x16 cells
+    # instead of thousands-of-pixel ones
+    if face_image.shape[0] > 64 and face_image.shape[1] > 64:
+        import cv2
+        face_image = cv2.resize(face_image, (64, 64),
+                                interpolation=cv2.INTER_AREA)
     
     # Get dimensions
     height, width = face_image.shape[:2]
-    
+
     # Define a 4x4 grid
     grid_height = height // 4
     grid_width = width // 4
-    
-    grid_colors = []
-    
-    for row in range(4):
-        for col in range(4):
-            # Calculate grid cell boundaries
-            gx1 = col * grid_width
-            gy1 = row * grid_height
-            gx2 = (col + 1) * grid_width
-            gy2 = (row + 1) * grid_height
-            
-            # Extract grid cell sub-image
-            cell_image = face_image[gy1:gy2, gx1:gx2]
-            
-            # Get the dominant color in this cell
-            color = get_dominant_color(cell_image)
-            grid_colors.append(color)
-            
-    return grid_colors
+
+    # Crop to a multiple of the grid size, then reshape into
+    # (4, cell_h, 4, cell_w, 3) tiles and average each tile in one
+    # vectorized reduction — all 16 dominant colors in a single call
+    # instead of 16 Python-level slice-and-reduce passes
+    cropped = face_image[:4 * grid_height, :4 * grid_width]
+    cells = cropped.reshape(4, grid_height, 4, grid_width, 3).mean(axis=(1, 3))
+
+    return cells.reshape(16, 3).astype(int).tolist()
     
 def get_dominant_color(image):
     """
@@ -158,18 +194,10 @@ def get_dominant_color(image):
     Returns:
         list: RGB color (e.g., [255, 0, 0] for red).
     """
-    # Reshape the image to be a list of pixels
-    pixels = image.reshape(-1, 3)
-    
-    # Cluster the pixel colors
-    kmeans = KMeans(n_clusters=1)
-    kmeans.fit(pixels)
-    
-    # Get the dominant color
-    dominant_color = kmeans.cluster_centers_[0]
-    
-    # Convert to integer RGB
-    return [int(c) for c in dominant_color]
+    # KMeans with k=1 converges to the centroid of the pixels, i.e.
+    # their arithmetic mean — compute that directly as a single
+    # vectorized reduction instead of fitting a clusterer per cell
+    return image.reshape(-1, 3).mean(axis=0).astype(int).tolist()
     
 def standardize_colors(face_colors):
     """
@@ -181,30 +209,31 @@ def standardize_colors(face_colors):
     Returns:
         dict: Dictionary with standardized colors.
     """
-    # Collect all colors
-    all_colors = []
-    for colors in face_colors.values():
-        all_colors.extend(colors)
-        
-    # Use K-means to find 12 color clusters (one for each face)
-    kmeans = KMeans(n_clusters=12)
+    from sklearn.cluster import KMeans
+
+    # Collect all colors into a single (N, 3) array
+    all_colors = np.asarray([color for colors in face_colors.values()
+                             for color in colors], dtype=np.float64)
+
+    # Use K-means to find 12 color clusters (one for each face).
+    # A single init and a short iteration cap are plenty for ~192
+    # well-separated 3-D points; the default n_init=10 multiplies the
+    # fit cost tenfold for no quality gain here.
+    kmeans = KMeans(n_clusters=12, n_init=1, max_iter=20, random_state=0)
     kmeans.fit(all_colors)
-    cluster_centers = kmeans.cluster_centers_
-    
-    # Function to find closest cluster center
-    def closest_center(color):
-        distances = [math.sqrt(sum((c - color_value)**2 for c, color_value in zip(center, color))) 
-                    for center in cluster_centers]
-        return np.argmin(distances)
-    
-    # Map each color to its closest cluster center
+
+    # Assign every color to its nearest center in one vectorized call
+    # (predict uses cached center norms instead of per-color Python
+    # loops) and look the snapped colors up by label
+    labels = kmeans.predict(all_colors)
+    snapped = kmeans.cluster_centers_[labels].astype(int)
+
+    # Slice the snapped colors back into the per-face lists
     standardized = {}
+    offset = 0
     for face_idx, colors in face_colors.items():
-        standardized_colors = []
-        for color in colors:
-            center_idx = closest_center(color)
-            std_color = [int(c) for c in cluster_centers[center_idx]]
-            standardized_colors.append(std_color)
-        standardized[face_idx] = standardized_colors
-        
+        count = len(colors)
+        standardized[face_idx] = snapped[offset:offset + count].tolist()
+        offset += count
+
     return standardized
\ No newline at end of file